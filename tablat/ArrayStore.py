@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+from .ColumnStore import ColumnStore
+from .TextWidth import TextWidth
+
+
+def _import_numpy():
+    """
+    Import `numpy` the first time it is needed, so importing `tablat` doesn't load it
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('numpy is required to store the table data in arrays')
+
+    return numpy
+
+
+class ArrayStore(ColumnStore):
+    """
+    Columnar storage backed by `numpy` arrays, used by `Table.from_numpy` and
+        `Table.from_dataframe`.
+
+    The columns are kept as the original arrays and the text of the cells is
+        calculated for each column at once with `numpy` string operations. Rows are
+        read from the arrays in chunks of `chunk_size` rows. When new data is added
+        the columns are converted to lists and the store works as a `ColumnStore`.
+
+    Requires `numpy` to be installed.
+    """
+
+    __slots__ = ('_arrays',)
+
+    chunk_size = 10000
+
+    def _reset(self, num_columns):
+        super()._reset(num_columns)
+        self._arrays = False
+
+    @staticmethod
+    def split_columns(array):
+        """
+        Return a list with the columns of a 2 dimensions array, as views of the array.
+            A 1 dimension array is a single column.
+
+        Args:
+            array (numpy.ndarray): The array to split.
+
+        Returns:
+            list: The columns of the array
+        """
+        numpy = _import_numpy()
+        array = numpy.asarray(array)
+        if array.ndim == 1:
+            return [array]
+
+        return [array[:, i] for i in range(array.shape[1])]
+
+    @classmethod
+    def from_columns(cls, columns, texts=None):
+        """
+        Create a store from a list of arrays (or sequences) with the same lenght.
+
+        Args:
+            columns (list): A list with the content of each column.
+            texts (list): Optional list with the text of the cells of each column.
+                If not provided it is calculated.
+
+        Returns:
+            tablat.ArrayStore: The new store
+        """
+        numpy = _import_numpy()
+        columns = [numpy.asarray(column) for column in columns]
+        num_rows = len(columns[0]) if columns else 0
+        if any(len(column) != num_rows for column in columns):
+            raise ValueError('All the columns must have the same lenght')
+
+        if texts is None:
+            texts = [column.astype(str) for column in columns]
+
+        store = cls(len(columns))
+        store._columns = columns
+        store._texts = texts
+        store._num_cells = num_rows * len(columns)
+        store._arrays = True
+        return store
+
+    def _to_lists(self):
+        """
+        Convert the column arrays to lists
+        """
+        if self._arrays:
+            self._columns = [column.tolist() for column in self._columns]
+            self._texts = [texts.tolist() for texts in self._texts]
+            self._arrays = False
+
+    def extend(self, data):
+        self._to_lists()
+        return super().extend(data)
+
+    def text_width(self, index):
+        if not self._arrays:
+            return super().text_width(index)
+
+        return self.chunk_width(self._texts[index])
+
+    @staticmethod
+    def chunk_width(texts):
+        if isinstance(texts, list):
+            return ColumnStore.chunk_width(texts)
+
+        numpy = _import_numpy()
+        if not isinstance(texts, numpy.ndarray) or texts.dtype.kind != 'U':
+            return ColumnStore.chunk_width(texts)
+
+        if not len(texts):
+            return 0
+
+        # The code points of the texts, to check if they are plain ASCII
+        codes = numpy.ascontiguousarray(texts).view(numpy.uint32)
+        if codes.max() >= 128 or (codes == 0x1b).any():
+            return TextWidth.max_width(texts.tolist())
+
+        return int(numpy.char.str_len(texts).max())
+
+    def rows(self, indexes=None, start=0, stop=None, step=1, text=False):
+        if not self._arrays:
+            return super().rows(indexes, start, stop, step, text)
+
+        num_rows = self.num_rows
+        stop = num_rows if stop is None else min(stop, num_rows)
+        if indexes is None:
+            indexes = range(self._num_columns)
+
+        columns = self._texts if text else self._columns
+        return self._iter_chunks([columns[i] for i in indexes], start, stop, step)
+
+    def _iter_chunks(self, columns, start, stop, step):
+        """
+        Generates the rows of the arrays, converting them to lists in chunks
+        """
+        chunk_lenght = self.chunk_size * step
+        for chunk_start in range(start, stop, chunk_lenght):
+            chunk_stop = min(chunk_start + chunk_lenght, stop)
+            yield from zip(*[column[chunk_start:chunk_stop:step].tolist() for column in columns])
+
+    def take(self, positions, indexes=None, text=False):
+        if not self._arrays:
+            return super().take(positions, indexes, text)
+
+        if indexes is None:
+            indexes = range(self._num_columns)
+
+        numpy = _import_numpy()
+        columns = self._texts if text else self._columns
+        return self._iter_positions([columns[i] for i in indexes], numpy.asarray(positions, dtype=numpy.intp))
+
+    def _iter_positions(self, columns, positions):
+        """
+        Generates the rows at `positions` of the arrays, converting them to lists in chunks
+        """
+        for chunk_start in range(0, len(positions), self.chunk_size):
+            chunk = positions[chunk_start:chunk_start + self.chunk_size]
+            yield from zip(*[column[chunk].tolist() for column in columns])
+
+    def find(self, index, value):
+        if not self._arrays:
+            return super().find(index, value)
+
+        return _import_numpy().flatnonzero(self._columns[index] == value).tolist()
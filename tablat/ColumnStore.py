@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+from itertools import islice
+from .TextWidth import TextWidth
+
+
+class ColumnStore(object):
+    """
+    Columnar storage for the data of a `Table`.
+
+    Each column is kept in its own sequence. Cells are added in row order, so the
+        cell `i` of a flat data list goes to column `i % num_columns`, and the last
+        row may be incomplete. Without columns the cells are kept in a flat list
+        until the store is reshaped.
+
+    The text of each cell (`str(cell)`) is calculated once when the cell is added
+        and cached in a parallel list for each column, so width calculations and
+        rendering don't convert the same cell again.
+
+    Attributes:
+        num_columns (int): Number of columns of the store.
+        data (list): Optional flat list with the initial cells, row after row.
+    """
+
+    __slots__ = ('_num_columns', '_num_cells', '_loose', '_columns', '_texts')
+
+    def __init__(self, num_columns=0, data=None):
+        self._reset(num_columns)
+        if data:
+            self.extend(data)
+
+    @classmethod
+    def from_columns(cls, columns, texts=None):
+        """
+        Create a store from the content of each column. Columns shorter than the
+            longest one are filled with empty cells (`''`). The lists are used by
+            the store, not copied.
+
+        Args:
+            columns (list): A list with the content of each column.
+            texts (list): Optional list with the text of the cells of each column.
+                If not provided it is calculated.
+
+        Returns:
+            tablat.ColumnStore: The new store
+        """
+        columns = [column if isinstance(column, list) else list(column) for column in columns]
+        num_rows = max(map(len, columns), default=0)
+        for column in columns:
+            column.extend([''] * (num_rows - len(column)))
+
+        if texts is None:
+            texts = [list(map(str, column)) for column in columns]
+
+        else:
+            for column_texts in texts:
+                column_texts.extend([''] * (num_rows - len(column_texts)))
+
+        store = cls(len(columns))
+        store._columns = columns
+        store._texts = texts
+        store._num_cells = num_rows * len(columns)
+        return store
+
+    def _reset(self, num_columns):
+        """
+        Empty the store and set the number of columns
+        """
+        self._num_columns = num_columns
+        self._num_cells = 0
+        self._loose = []
+        self._columns = [[] for _ in range(num_columns)]
+        self._texts = [[] for _ in range(num_columns)]
+
+    def __len__(self):
+        return self._num_cells
+
+    @property
+    def num_columns(self):
+        """
+        Number of columns in the store
+        """
+        return self._num_columns
+
+    @property
+    def num_rows(self):
+        """
+        Number of complete rows in the store
+        """
+        if not self._num_columns:
+            return 0
+
+        return self._num_cells // self._num_columns
+
+    def extend(self, data):
+        """
+        Add cells to the store, following the row order.
+
+        Args:
+            data (list): Flat list of cells to add
+
+        Returns:
+            list: The text of the added cells, in the same order. Empty if the
+                store has no columns.
+        """
+        num_columns = self._num_columns
+        if num_columns and type(data) is list and len(data) == num_columns and not self._num_cells % num_columns:
+            # A single complete row, the most common case when rows are added one by one
+            texts = []
+            for column, column_texts, cell in zip(self._columns, self._texts, data):
+                text = str(cell)
+                column.append(cell)
+                column_texts.append(text)
+                texts.append(text)
+
+            self._num_cells += num_columns
+            return texts
+
+        if not isinstance(data, (list, tuple)):
+            data = list(data)
+
+        if not num_columns:
+            self._loose.extend(data)
+            self._num_cells += len(data)
+            return []
+
+        offset = self._num_cells
+        texts = list(map(str, data))
+
+        for i in range(min(num_columns, len(data))):
+            col_index = (offset + i) % num_columns
+            self._columns[col_index].extend(data[i::num_columns])
+            self._texts[col_index].extend(texts[i::num_columns])
+
+        self._num_cells += len(data)
+        return texts
+
+    def column(self, index):
+        """
+        Return the sequence with the content of a column. The sequence is not copied,
+            it should not be modified.
+
+        Args:
+            index (int): Index of the column
+
+        Returns:
+            list: The content of the column
+        """
+        return self._columns[index]
+
+    def text_column(self, index):
+        """
+        Return the sequence with the cached text of the cells of a column. The
+            sequence is not copied, it should not be modified.
+
+        Args:
+            index (int): Index of the column
+
+        Returns:
+            list: The text of each cell in the column
+        """
+        return self._texts[index]
+
+    def text_width(self, index):
+        """
+        Return the display width of the widest cell text of a column (see `TextWidth`).
+
+        Args:
+            index (int): Index of the column
+
+        Returns:
+            int: The max width, `0` for an empty column
+        """
+        return TextWidth.max_width(self._texts[index])
+
+    def text_chunks(self, index, chunk_size):
+        """
+        Generates the cached text of the cells of a column in chunks.
+
+        Args:
+            index (int): Index of the column
+            chunk_size (int): Number of cells of each chunk
+
+        Yields:
+            list: The text of the next `chunk_size` cells
+        """
+        texts = self._texts[index]
+        for start in range(0, len(texts), chunk_size):
+            yield texts[start:start + chunk_size]
+
+    @staticmethod
+    def chunk_width(texts):
+        """
+        Return the display width of the widest text of a chunk (see `text_chunks`).
+
+        Args:
+            texts (list): The text of the cells
+
+        Returns:
+            int: The max width, `0` for an empty chunk
+        """
+        return TextWidth.max_width(texts)
+
+    def row(self, index):
+        """
+        Return a list with the cells of a row. If the row is incomplete only the
+            available cells are returned, and an empty list if it does not exist.
+
+        Args:
+            index (int): Index of the row, negative values count from the last row.
+
+        Returns:
+            list: The cells of the row
+        """
+        if index < 0:
+            index += -(-self._num_cells // self._num_columns) if self._num_columns else 0
+
+        if index < 0:
+            return []
+
+        return [column[index] for column in self._columns if index < len(column)]
+
+    def rows(self, indexes=None, start=0, stop=None, step=1, text=False):
+        """
+        Return an iterator over the complete rows of the store, as tuples.
+
+        Args:
+            indexes (list): Indexes of the columns to include in the rows. By default
+                all columns are included.
+            start (int): First row to include.
+            stop (int): Row where the iteration stops. By default all rows are included.
+            step (int): Step between rows. Default value `1`
+            text (bool): `True` to get the cached text of the cells instead of the cells.
+
+        Returns:
+            iterator: Tuples with the cells of each row
+        """
+        num_rows = self.num_rows
+        stop = num_rows if stop is None else min(stop, num_rows)
+        if indexes is None:
+            indexes = range(self._num_columns)
+
+        columns = self._texts if text else self._columns
+        if start:
+            # Slices copy only the window, islice would walk all the previous rows
+            return zip(*[columns[i][start:stop:step] for i in indexes])
+
+        return zip(*[islice(columns[i], start, stop, step) for i in indexes])
+
+    def take(self, positions, indexes=None, text=False):
+        """
+        Return an iterator over the rows at the given positions, as tuples.
+
+        Args:
+            positions (list): Positions of the rows, in the order they are returned.
+            indexes (list): Indexes of the columns to include in the rows. By default
+                all columns are included.
+            text (bool): `True` to get the cached text of the cells instead of the cells.
+
+        Returns:
+            iterator: Tuples with the cells of each row
+        """
+        if indexes is None:
+            indexes = range(self._num_columns)
+
+        columns = self._texts if text else self._columns
+        return zip(*[map(columns[i].__getitem__, positions) for i in indexes])
+
+    def find(self, index, value):
+        """
+        Return the positions of the complete rows with a value in a column.
+
+        Args:
+            index (int): Index of the column
+            value: Value to find
+
+        Returns:
+            list: The positions of the rows, in ascending order
+        """
+        column = islice(self._columns[index], self.num_rows)
+        return [i for i, cell in enumerate(column) if cell == value]
+
+    def flat(self):
+        """
+        Return a flat list with all the cells in row order
+        """
+        if not self._num_columns:
+            return self._loose[:]
+
+        flat_data = [None] * self._num_cells
+        for i, column in enumerate(self._columns):
+            flat_data[i::self._num_columns] = column
+
+        return flat_data
+
+    def reshape(self, num_columns):
+        """
+        Redistribute the cells of the store into a different number of columns,
+            keeping the row order.
+
+        Args:
+            num_columns (int): New number of columns
+        """
+        if num_columns == self._num_columns:
+            return
+
+        flat_data = self.flat()
+        self._reset(num_columns)
+        self.extend(flat_data)
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+from array import array
+from .ColumnStore import ColumnStore
+from .TextWidth import TextWidth
+
+
+class _EncodedColumn(object):
+    """
+    Read only sequence of values stored as codes of a list of distinct values
+    """
+
+    __slots__ = ('values', 'codes', 'lookup')
+
+    def __init__(self, values, codes, lookup):
+        self.values = values
+        self.codes = codes
+        self.lookup = lookup
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __iter__(self):
+        return map(self.values.__getitem__, self.codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(map(self.values.__getitem__, self.codes[index]))
+
+        return self.values[self.codes[index]]
+
+    def extend(self, values):
+        lookup = self.lookup
+        for value in values:
+            if value not in lookup:
+                lookup[value] = len(self.values)
+                self.values.append(value)
+
+        self.codes.extend(map(lookup.__getitem__, values))
+
+
+class _TextColumn(object):
+    """
+    Read only sequence with the text of the values of a column, converted when read
+    """
+
+    __slots__ = ('column',)
+
+    def __init__(self, column):
+        self.column = column
+
+    def __len__(self):
+        return len(self.column)
+
+    def __iter__(self):
+        return map(str, self.column)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(map(str, self.column[index]))
+
+        return str(self.column[index])
+
+
+class CompactStore(ColumnStore):
+    """
+    Columnar storage that reduces the memory used by big columns, used by
+        `CompactTable`.
+
+    When a column grows past `min_size` cells (and each time its size doubles)
+        its content is checked:
+        - Columns with only `int` or only `float` values are kept in an `array`,
+            and the text of the cells is calculated when it is read instead of cached.
+        - Columns with only `str` values where the number of distinct values is
+            no more than `max_distinct_ratio` times the number of cells (by default
+            half of them) are dictionary encoded: each distinct value is kept once
+            and the cells are codes in an `array`.
+
+    Values added later that don't fit in the compact column turn it back into a list.
+        Cells are returned with the same type and text, so tables render the same.
+    """
+
+    __slots__ = ('_next_check',)
+
+    min_size = 1024
+    max_distinct_ratio = 0.5
+
+    def _reset(self, num_columns):
+        super()._reset(num_columns)
+        self._next_check = [self.min_size] * num_columns
+
+    @classmethod
+    def from_columns(cls, columns, texts=None):
+        store = super().from_columns(columns, texts)
+        for i in range(store._num_columns):
+            store._compact_column(i)
+
+        return store
+
+    def _compact_column(self, index):
+        """
+        Convert a list column to its compact form, if its content allows it
+        """
+        column = self._columns[index]
+        self._next_check[index] = max(len(column) * 2, self.min_size)
+        if not isinstance(column, list) or len(column) < self.min_size:
+            return
+
+        first_type = type(column[0])
+        if first_type not in (int, float, str) or any(type(cell) is not first_type for cell in column):
+            return
+
+        if first_type is str:
+            encoded = _EncodedColumn([], array('I'), {})
+            encoded.extend(column)
+            if len(encoded.values) <= len(column) * self.max_distinct_ratio:
+                # `str` values are their own text
+                self._columns[index] = encoded
+                self._texts[index] = encoded
+
+            return
+
+        if first_type is int and not self._fits_int64(column):
+            return
+
+        compact = array('q' if first_type is int else 'd', column)
+        self._columns[index] = compact
+        self._texts[index] = _TextColumn(compact)
+
+    def _expand_column(self, index):
+        """
+        Convert a compact column back to a list
+        """
+        column = list(self._columns[index])
+        self._columns[index] = column
+        self._texts[index] = list(map(str, column))
+        self._next_check[index] = len(column) * 2
+
+    def _fits(self, index, values):
+        """
+        Return `True` if the values can be added to the compact column
+        """
+        column = self._columns[index]
+        if isinstance(column, _EncodedColumn):
+            return all(type(value) is str for value in values)
+
+        if column.typecode == 'd':
+            return all(type(value) is float for value in values)
+
+        return all(type(value) is int for value in values) and self._fits_int64(values)
+
+    @staticmethod
+    def _fits_int64(values):
+        """
+        Return `True` if all the integers can be stored in a signed 64 bits array
+        """
+        return -(1 << 63) <= min(values) and max(values) < (1 << 63)
+
+    def extend(self, data):
+        if not isinstance(data, (list, tuple)):
+            data = list(data)
+
+        if not self._num_columns:
+            return super().extend(data)
+
+        num_columns = self._num_columns
+        offset = self._num_cells
+        texts = list(map(str, data))
+        for i in range(min(num_columns, len(data))):
+            col_index = (offset + i) % num_columns
+            values = data[i::num_columns]
+            column = self._columns[col_index]
+            if not isinstance(column, list):
+                if self._fits(col_index, values):
+                    column.extend(values)
+                    continue
+
+                self._expand_column(col_index)
+                column = self._columns[col_index]
+
+            column.extend(values)
+            self._texts[col_index].extend(texts[i::num_columns])
+            if len(column) >= self._next_check[col_index]:
+                self._compact_column(col_index)
+
+        self._num_cells += len(data)
+        return texts
+
+    def text_width(self, index):
+        texts = self._texts[index]
+        if isinstance(texts, _EncodedColumn):
+            return TextWidth.max_width(texts.values)
+
+        return super().text_width(index)
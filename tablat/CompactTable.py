@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+from .Table import Table
+from .CompactStore import CompactStore
+
+
+class CompactTable(Table):
+    """
+    `Table` that keeps its data in a `tablat.CompactStore`, to reduce the memory
+        used by big tables with numeric columns or columns with few distinct
+        strings. It is used and rendered exactly like a `Table`, but rendering
+        numeric columns is slower because the text of their cells is not cached.
+
+    Attributes:
+        table_data: An iterable containing the data to print in the table.
+                    By default an empty list
+        headers: Title of each column in the table. By default an empty list.
+        style (tablat.TabStyle): Style object to define the aspect of the table.
+    """
+
+    __slots__ = ()
+
+    _store_class = CompactStore
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+import re
+import json
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+DELIMITERS = ' \t\n\r,]}'
+
+
+class JsonReader(object):
+    """
+    Incremental reader for big `json` files.
+
+    The file is read in chunks and the values are decoded one by one, so the whole
+        file is never loaded in memory.
+
+    Attributes:
+        fp: Text stream with the `json` content.
+        chunk_size (int): Number of characters read from the stream each time.
+            Default value `1048576`
+    """
+
+    def __init__(self, fp, chunk_size=1 << 20):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _read(self):
+        """
+        Read the next chunk, dropping the consumed part of the buffer. Returns
+            `False` at the end of the file.
+        """
+        if self._eof:
+            return False
+
+        chunk = self._fp.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        """
+        Return the next character that is not a whitespace, without consuming it.
+            Returns an empty `str` at the end of the file.
+        """
+        while True:
+            self._pos = WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+
+            if not self._read():
+                return ''
+
+    def _expect(self, chars):
+        """
+        Consume the next character, that must be one of `chars`, and return it
+        """
+        char = self._peek()
+        if not char or char not in chars:
+            raise ValueError('Invalid json file, expected one of {!r} but found {!r}'.format(chars, char))
+
+        self._pos += 1
+        return char
+
+    def _value(self):
+        """
+        Decode the next value. If the buffer ends in the middle of the value more
+            data is read, as a truncated number would be decoded without errors
+            (`12` from `12.5`), so numbers must be followed by a delimiter.
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                if self._eof or (end < len(self._buffer) and (
+                        self._buffer[end] in DELIMITERS or type(value) not in (int, float))):
+                    self._pos = end
+                    return value
+
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+
+            self._read()
+
+    def iter_array(self):
+        """
+        Generates the items of the next `json` array.
+
+        Yields:
+            The next decoded item.
+        """
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+
+        while True:
+            yield self._value()
+            if self._expect(',]') == ']':
+                return
+
+    def iter_columns(self):
+        """
+        Generates the columns of a `json` object with lists as values:
+            `{'col_name1': [it11, it12, it13], 'col_name2: [it21, it22, it23]}`
+
+        Yields:
+            tuple: The column name and an iterator with the column items. The
+                iterator must be consumed before getting the next column.
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+
+        while True:
+            name = self._value()
+            if not isinstance(name, str):
+                raise ValueError('Invalid json file, expected a column name but found {!r}'.format(name))
+
+            self._expect(':')
+            yield name, self.iter_array()
+            if self._expect(',}') == '}':
+                return
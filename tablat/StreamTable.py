@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+from itertools import chain, islice
+from functools import partial
+from collections import deque
+from .Table import Table
+
+
+class StreamTable(Table):
+    """
+    `Table` backed by an iterable of rows instead of the in memory data list.
+
+    The rows are consumed while the table is rendered, so the whole dataset never
+        needs to fit in memory. Column widths are obtained (by priority) from the
+        declared `widths`, from a first pass over the source when `two_pass` is set
+        or from a sample of the first `sample_size` rows. Cells longer than the
+        sampled width are printed unaligned.
+
+    Attributes:
+        rows: An iterable of rows, each row an iterable with the data of each column.
+            Short rows are filled with empty cells and extra cells are ignored.
+            If `rows` is an iterator it can be rendered only once.
+        headers: Title of each column in the table.
+        style (tablat.TabStyle): Style object to define the aspect of the table.
+        widths (list): Width of each column. If provided the data is not scanned.
+        sample_size (int): Number of rows read in advance to calculate column widths.
+            Default value `1000`
+        two_pass (bool): `True` to read the whole source to calculate the column
+            widths before rendering. `rows` must be re-iterable (a list, a file path
+            reader...), not an iterator. Default value `False`
+        executor (concurrent.futures.Executor): Optional pool used to format the
+            rows in chunks (see `tablat.Table`).
+    """
+
+    __slots__ = ('_row_source', '_widths', '_sample_size', '_two_pass')
+
+    def __init__(self, rows, headers, style=None, widths=None, sample_size=1000, two_pass=False,
+                 executor=None):
+        if two_pass and iter(rows) is rows:
+            raise ValueError('Two pass mode needs a re-iterable row source, an iterator was provided')
+
+        super().__init__(headers=headers, style=style, executor=executor)
+        # The source may change between renders, outputs are never cached
+        self._render_cache_size = 0
+        self._row_source = rows
+        self._widths = list(widths) if widths else None
+        self._sample_size = sample_size
+        self._two_pass = two_pass
+
+    @classmethod
+    def from_cursor(cls, cursor, batch_size=1000, style=None, widths=None, sample_size=1000):
+        """
+        Create a table that renders the result of a query in a DB-API cursor while
+            it is fetched with `fetchmany`, so the result is never kept in memory.
+            The headers are the column names in `cursor.description`.
+
+        Args:
+            cursor: A DB-API cursor with an executed query.
+            batch_size (int): Number of rows fetched at once. Default value `1000`
+            style (tablat.TabStyle): Style object to define the aspect of the table.
+            widths (list): Width of each column. If provided the data is not scanned.
+            sample_size (int): Number of rows read in advance to calculate column widths.
+
+        Returns:
+            tablat.StreamTable: The new table.
+        """
+        rows = chain.from_iterable(cls._fetch_batches(cursor, batch_size))
+        headers = [column[0] for column in cursor.description]
+        return cls(rows, headers, style, widths, sample_size)
+
+    def _fit_row(self, row, text=True):
+        """
+        Return a row list with exactly one cell per column, with the text of the
+            cells if `text` is `True`
+        """
+        row = list(map(str, row)) if text else list(row)
+        if len(row) < self._num_columns:
+            row.extend([''] * (self._num_columns - len(row)))
+
+        return row[:self._num_columns]
+
+    def _update_row_lenght(self, row, text):
+        """
+        Updates max lenght of columns from a row
+        """
+        self._update_columns_max_lenght(row if text else list(map(str, row)))
+
+    def _render_window(self, rows, footer, show_columns, hide_columns):
+        """
+        Return the rendered `rows` taken from the source followed by a `footer` line.
+            The column widths are calculated from those rows.
+        """
+        source = self._row_source
+        self._row_source = rows
+        try:
+            return self._render_partial(None, footer, show_columns, hide_columns)
+
+        finally:
+            self._row_source = source
+
+    def head(self, num_rows=10, show_columns=None, hide_columns=None):
+        """
+        Returns the first rows of the source as a `str` (see `Table.head`). The number
+            of rows of a stream is unknown, so the last line is `... more rows` if
+            there are more rows. The rows read are consumed from an iterator source.
+        """
+        return self.page(0, num_rows, show_columns, hide_columns)
+
+    def tail(self, num_rows=10, show_columns=None, hide_columns=None):
+        """
+        Returns the last rows of the source as a `str` (see `Table.tail`). The whole
+            source is read, keeping only the last `num_rows` rows in memory.
+        """
+        window = deque(maxlen=num_rows)
+        total = 0
+        for row in self._row_source:
+            window.append(row)
+            total += 1
+
+        hidden = total - len(window)
+        footer = '... {} more rows'.format(hidden) if hidden else ''
+        return self._render_window(list(window), footer, show_columns, hide_columns)
+
+    def page(self, page_number, page_size=20, show_columns=None, hide_columns=None):
+        """
+        Returns a page of the source as a `str` (see `Table.page`). The previous rows
+            are skipped and the last line is `... more rows` if there are more rows.
+            Column widths are calculated for each page, unless they are declared.
+        """
+        if page_number < 0:
+            raise ValueError('Invalid page number: {}. Pages are numbered from 0'.format(page_number))
+
+        rows = iter(self._row_source)
+        start = page_number * page_size
+        window = list(islice(rows, start, start + page_size))
+        footer = '... more rows' if next(rows, None) is not None else ''
+        return self._render_window(window, footer, show_columns, hide_columns)
+
+    def _get_rows(self, indexes, rows=None, text=True, widths=True, row_index=None):
+        """
+        Return an iterator over the rows of the source, with the cells of the columns
+            in `indexes`, limited to the `rows` slice (negative values are not allowed).
+            Column widths are calculated before returning, unless `widths` is `False`.
+        """
+        if row_index is not None:
+            raise ValueError('The rows of a StreamTable can not be sorted or filtered')
+
+        self._calc_columns_max_lenght()
+        fit_row = partial(self._fit_row, text=text)
+        source_rows = map(fit_row, self._row_source)
+
+        if not widths or all(self._width_limits.get(i, (0, False))[1] for i in range(self._num_columns)):
+            # Widths are not needed or fixed for all the columns
+            pass
+
+        elif self._widths:
+            declared = [self._limit_width(i, max(w, h)) for i, (w, h) in enumerate(zip(self._widths, self._column_max))]
+            self._column_max = declared + self._column_max[len(declared):]
+
+        elif self._two_pass:
+            for row in source_rows:
+                self._update_row_lenght(row, text)
+
+            source_rows = map(fit_row, self._row_source)
+
+        else:
+            sample = list(islice(source_rows, self._sample_size))
+            for row in sample:
+                self._update_row_lenght(row, text)
+
+            source_rows = chain(sample, source_rows)
+
+        if rows is not None:
+            source_rows = islice(source_rows, rows.start, rows.stop, rows.step)
+
+        return ([row[i] for i in indexes] for row in source_rows)
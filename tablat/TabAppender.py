@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+
+class TabAppender(object):
+    """
+    Buffered writer that adds complete rows to a `Table`, created with `Table.appender()`.
+
+    Rows are kept in a local buffer and added to the table in batches of `batch_size`
+        rows, each batch in a single locked step. Several threads can add rows to the
+        same table, each one with its own appender, without mixing the cells of their
+        rows. Short rows are filled with empty cells and extra cells are ignored.
+
+    The appender can be used as a context manager, the pending rows are added when
+        the block ends:
+        `with table.appender() as appender: appender.add_row(row)`
+
+    Attributes:
+        table (tablat.Table): Table where the rows are added.
+        batch_size (int): Number of rows buffered before they are added.
+            Default value `1000`
+    """
+
+    __slots__ = ('_table', '_batch_size', '_buffer', '_num_rows')
+
+    def __init__(self, table, batch_size=1000):
+        self._table = table
+        self._batch_size = batch_size
+        self._buffer = []
+        self._num_rows = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+    def add_row(self, row):
+        """
+        Add a row to the buffer, adding the buffered rows to the table if the buffer is full.
+
+        Args:
+            row (iterable): The data of each column.
+        """
+        num_columns = self._table._num_columns
+        row = list(row)[:num_columns]
+        if len(row) < num_columns:
+            row.extend([''] * (num_columns - len(row)))
+
+        self._buffer.extend(row)
+        self._num_rows += 1
+        if self._num_rows >= self._batch_size:
+            self.flush()
+
+    def add_rows(self, rows):
+        """
+        Add several rows to the buffer (see `add_row`).
+
+        Args:
+            rows (iterable): The rows to add.
+        """
+        for row in rows:
+            self.add_row(row)
+
+    def flush(self):
+        """
+        Add the buffered rows to the table.
+        """
+        if not self._buffer:
+            return
+
+        buffer = self._buffer
+        self._buffer = []
+        self._num_rows = 0
+        self._table.add_data(buffer)
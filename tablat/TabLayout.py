@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+from itertools import islice
+from .TextWidth import TextWidth
+
+
+class TabLayout(object):
+    """
+    Compiled layout of a table for a style, column widths and alignments.
+
+    The layout is built once and holds a single format template for the rows and
+        the fixed separator lines, so each row is rendered with one `format` call.
+        Lines with non ASCII characters or escape codes are formatted again padding
+        the cells by their display width (see `TextWidth`).
+
+    Attributes:
+        style (tablat.TabStyle): Style of the table.
+        column_max (list): Width of each displayed column.
+        align_list (list): Alignment character of each displayed column.
+        colspace (int): Number of spaces between columns. Default value `3`
+    """
+
+    batch_size = 512
+
+    def __init__(self, style, column_max, align_list, colspace=3):
+        margin = ' ' * colspace
+        col_space = margin
+        borders = ''
+        if style.col_sep:
+            col_space = '{s}|{s}'.format(s=' ' * round(colspace / 2))
+
+        if style.borders:
+            borders = '|'
+
+        cell_formats = ['{{:{al}{l}}}'.format(al=al, l=l) for al, l in zip(align_list, column_max)]
+        self._row_template = borders + margin + col_space.join(cell_formats) + margin + borders
+        self._wide_template = borders + margin + col_space.join(['{}'] * len(column_max)) + margin + borders
+        self._cells = list(zip(column_max, align_list))
+
+        line_lenght = sum(column_max) + colspace * 2 + max(len(column_max) - 1, 0) * len(col_space)
+        self.top = ' {} '.format('_' * line_lenght) if style.borders else ''
+        self.header_sep = '{b}{l}{b}'.format(b=borders, l=('=' if style.row_sep else '-') * line_lenght)
+        self.row_sep = '{b}{l}{b}'.format(b=borders, l='-' * line_lenght) if style.row_sep else None
+        self.bottom = '|{}|'.format('_' * line_lenght) if style.borders else None
+
+    def format_row(self, row):
+        """
+        Return the line of a row.
+
+        Args:
+            row (list): The text of each displayed cell.
+
+        Returns:
+            str: The formatted line
+        """
+        line = self._row_template.format(*row)
+        if line.isascii() and '\x1b' not in line:
+            return line
+
+        return self._format_wide(row)
+
+    def _format_wide(self, row):
+        """
+        Return the line of a row padding the cells by their display width
+        """
+        pad = TextWidth.pad
+        return self._wide_template.format(*[pad(cell, width, align) for cell, (width, align) in zip(row, self._cells)])
+
+    def header_lines(self, headers):
+        """
+        Return the top lines of a table with this layout: top border, headers and
+            headers separator.
+
+        Args:
+            headers (list): Headers of the displayed columns.
+
+        Returns:
+            list: The header lines.
+        """
+        return [self.top, self.format_row(headers), self.header_sep]
+
+    def row_lines(self, rows):
+        """
+        Generates the lines of the rows, with the row separators if needed.
+
+        Args:
+            rows (iterable): Rows with the text of each displayed cell.
+
+        Yields:
+            str: The next line.
+        """
+        row_template = self._row_template.format
+        row_sep = self.row_sep
+        rows = iter(rows)
+        batch = list(islice(rows, self.batch_size))
+        while batch:
+            lines = [row_template(*row) for row in batch]
+            # A single check for the whole batch in the common plain ASCII case
+            joined = ''.join(lines)
+            if not joined.isascii() or '\x1b' in joined:
+                lines = [line if TextWidth.is_plain(line) else self._format_wide(row)
+                         for line, row in zip(lines, batch)]
+
+            if row_sep is None:
+                yield from lines
+
+            else:
+                for line in lines:
+                    yield line
+                    yield row_sep
+
+            batch = list(islice(rows, self.batch_size))
+
+    def format_rows(self, rows):
+        """
+        Return the lines of the rows as a single `str`, each line ended with a line
+            break. Used to render chunks of rows in other threads or processes.
+
+        Args:
+            rows (list): Rows with the text of each displayed cell.
+
+        Returns:
+            str: The lines of the rows.
+        """
+        lines = list(self.row_lines(rows))
+        lines.append('')
+        return '\n'.join(lines)
+
+    def iter_lines(self, headers, rows):
+        """
+        Generates all the lines of a table with this layout.
+
+        Args:
+            headers (list): Headers of the displayed columns.
+            rows (iterable): Rows with the text of each displayed cell.
+
+        Yields:
+            str: The next line of the table.
+        """
+        yield from self.header_lines(headers)
+        yield from self.row_lines(rows)
+        if self.bottom is not None:
+            yield self.bottom
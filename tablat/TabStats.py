@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+from time import perf_counter
+
+
+class TabStats(object):
+    """
+    Counters and timers of the operations of a `Table`, enabled setting the `stats`
+        attribute of the table (`table.stats = TabStats()`). Without stats the table
+        only checks the attribute once per operation.
+
+    Timers accumulate the seconds spent in each phase:
+        - `widths`: Calculation of the column widths.
+        - `format`: Getting the rows and formatting the lines (everything that is
+            not widths or write).
+        - `write`: Calls to the `write` method of the output stream.
+        - `total`: Whole operations.
+
+    Counters:
+        - `operations`: Finished render and export operations.
+        - `rows_rendered`: Rows rendered or exported.
+        - `chars_written`: Characters of output produced.
+        - `cells_stringified`: Cells converted to text when they were stored.
+        - `cache_hits` / `cache_misses`: Lookups in the cache of `render()`.
+
+    Hooks are functions called with the name of an event (`render`, `export` or
+        `widths`) and a `dict` with the values of the event, to send the numbers
+        to other systems.
+
+    Attributes:
+        timers (dict): Seconds spent in each phase.
+        counters (dict): Value of each counter.
+    """
+
+    PHASES = ('widths', 'format', 'write', 'total')
+    COUNTERS = ('operations', 'rows_rendered', 'chars_written', 'cells_stringified', 'cache_hits', 'cache_misses')
+
+    def __init__(self):
+        self._hooks = []
+        self.reset()
+
+    def reset(self):
+        """
+        Set all the timers and counters to zero. Hooks are kept.
+        """
+        self.timers = dict.fromkeys(self.PHASES, 0.0)
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+
+    def add_hook(self, hook):
+        """
+        Register a function to be called after each event: `hook(event, values)`.
+
+        Args:
+            hook (callable): The function to call.
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook):
+        """
+        Remove a registered hook.
+
+        Args:
+            hook (callable): The function to remove.
+        """
+        self._hooks.remove(hook)
+
+    def count(self, name, value=1):
+        """
+        Increase a counter.
+
+        Args:
+            name (str): Name of the counter.
+            value (int): Value to add. Default value `1`
+        """
+        self.counters[name] += value
+
+    def add_time(self, phase, seconds):
+        """
+        Add time to the timer of a phase.
+
+        Args:
+            phase (str): Name of the phase.
+            seconds (float): Seconds to add.
+        """
+        self.timers[phase] += seconds
+
+    def emit(self, event, values):
+        """
+        Call the hooks with an event.
+
+        Args:
+            event (str): Name of the event.
+            values (dict): Values of the event.
+        """
+        for hook in self._hooks:
+            hook(event, values)
+
+    def start(self):
+        """
+        Return the start mark of an operation, to be passed to `finish`.
+
+        Returns:
+            tuple: The start time and the current timers and counters.
+        """
+        return perf_counter(), dict(self.timers), dict(self.counters)
+
+    def finish(self, event, mark):
+        """
+        Finish an operation started with `start`: updates the `total` and `format`
+            timers and calls the hooks with the values of the operation (`seconds`,
+            the time of each phase, `rows` and `chars`).
+
+        Args:
+            event (str): Name of the operation.
+            mark (tuple): The value returned by `start`.
+        """
+        start, timers, counters = mark
+        seconds = perf_counter() - start
+        widths = self.timers['widths'] - timers['widths']
+        write = self.timers['write'] - timers['write']
+        format_time = max(seconds - widths - write, 0.0)
+
+        self.timers['total'] += seconds
+        self.timers['format'] += format_time
+        self.counters['operations'] += 1
+        if self._hooks:
+            self.emit(event, {
+                'seconds': seconds,
+                'widths': widths,
+                'format': format_time,
+                'write': write,
+                'rows': self.counters['rows_rendered'] - counters['rows_rendered'],
+                'chars': self.counters['chars_written'] - counters['chars_written'],
+            })
+
+    def as_dict(self):
+        """
+        Return the timers and counters in a flat `dict`, timers with the `_seconds` suffix.
+
+        Returns:
+            dict: The current values.
+        """
+        values = {'{}_seconds'.format(phase): seconds for phase, seconds in self.timers.items()}
+        values.update(self.counters)
+        return values
@@ -5,6 +5,9 @@ class TabStyle(object):
     """
     Wrapper class to define the some style options for `Table` object.
 
+    Each change of the options increases a version counter, so the tables that
+        use the style know when their cached output is outdated.
+
     Attributes:
         borders (bool): `True` value to print borders around the table.
             Default value `True`
@@ -15,10 +18,13 @@ class TabStyle(object):
 
     """
 
+    __slots__ = ('_borders', '_row_sep', '_col_sep', '_version')
+
     def __init__(self, borders=True, row_sep=False, col_sep=False):
         self._borders = bool(borders)
         self._row_sep = bool(row_sep)
         self._col_sep = bool(col_sep)
+        self._version = 0
 
     def update(self, borders=True, row_sep=False, col_sep=False):
         """
@@ -34,6 +40,7 @@ class TabStyle(object):
         self._borders = bool(borders)
         self._row_sep = bool(row_sep)
         self._col_sep = bool(col_sep)
+        self._version += 1
 
     @property
     def borders(self):
@@ -45,6 +52,7 @@ class TabStyle(object):
     @borders.setter
     def borders(self, borders):
         self._borders = bool(borders)
+        self._version += 1
 
     @property
     def row_sep(self):
@@ -56,6 +64,7 @@ class TabStyle(object):
     @row_sep.setter
     def row_sep(self, row_sep):
         self._row_sep = bool(row_sep)
+        self._version += 1
 
     @property
     def col_sep(self):
@@ -67,3 +76,4 @@ class TabStyle(object):
     @col_sep.setter
     def col_sep(self, col_sep):
         self._col_sep = bool(col_sep)
+        self._version += 1
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+import csv
+import json
+import html
+
+
+class TabWriter(object):
+    """
+    Base class of the output formats used by `Table.export`.
+
+    A writer generates the lines of the output from the headers, alignments and rows
+        of a table. Subclasses set `text` to `False` to get the original cell values
+        instead of their text, and `widths` to `True` if they need the column widths.
+        New formats can be registered with `TabWriter.register`.
+    """
+
+    text = True
+    widths = False
+    _formats = {}
+
+    @classmethod
+    def register(cls, name, writer_class):
+        """
+        Register an output format, to be used by name in `Table.export`.
+
+        Args:
+            name (str): Name of the format.
+            writer_class (type): A `TabWriter` subclass.
+        """
+        cls._formats[name] = writer_class
+
+    @classmethod
+    def get(cls, output_format):
+        """
+        Return a writer for an output format.
+
+        Args:
+            output_format (str or tablat.TabWriter): Name of a registered format
+                (`csv`, `tsv`, `markdown`, `html`, `json`, `jsonl`) or a writer.
+
+        Returns:
+            tablat.TabWriter: The writer
+        """
+        if isinstance(output_format, TabWriter):
+            return output_format
+
+        try:
+            return cls._formats[output_format]()
+
+        except KeyError:
+            raise ValueError('Unknown output format: {}. Valid formats are {}'.format(
+                output_format, list(cls._formats.keys())))
+
+    def iter_lines(self, headers, align_list, column_max, rows):
+        """
+        Generates the lines of the output, without line breaks.
+
+        Args:
+            headers (list): Headers of the displayed columns.
+            align_list (list): Alignment of the displayed columns.
+            column_max (list): Width of the displayed columns, `None` if the
+                writer doesn't need widths.
+            rows (iterable): Rows with the cells of the displayed columns.
+
+        Yields:
+            str: The next line of the output.
+        """
+        raise NotImplementedError
+
+
+class _LastLine(object):
+    """
+    Minimal file object that keeps the last `str` written
+    """
+
+    value = ''
+
+    def write(self, value):
+        self.value = value
+
+
+class CsvWriter(TabWriter):
+    """
+    Writes the table as comma separated values.
+    """
+
+    delimiter = ','
+
+    def iter_lines(self, headers, align_list, column_max, rows):
+        line = _LastLine()
+        writer = csv.writer(line, delimiter=self.delimiter, lineterminator='')
+        writer.writerow(headers)
+        yield line.value
+
+        for row in rows:
+            writer.writerow(row)
+            yield line.value
+
+
+class TsvWriter(CsvWriter):
+    """
+    Writes the table as tab separated values.
+    """
+
+    delimiter = '\t'
+
+
+class MarkdownWriter(TabWriter):
+    """
+    Writes the table as a GitHub flavored Markdown table, keeping the alignment
+        of the columns.
+    """
+
+    _align_marks = {'<': ':---', '>': '---:', '^': ':---:'}
+
+    def iter_lines(self, headers, align_list, column_max, rows):
+        yield '| {} |'.format(' | '.join(str(h).replace('|', '\\|') for h in headers))
+        yield '| {} |'.format(' | '.join(self._align_marks.get(al, '---') for al in align_list))
+
+        for row in rows:
+            yield '| {} |'.format(' | '.join(cell.replace('|', '\\|') for cell in row))
+
+
+class HtmlWriter(TabWriter):
+    """
+    Writes the table as a HTML `table` element, keeping the alignment of the columns.
+    """
+
+    _align_styles = {'<': 'left', '>': 'right', '^': 'center'}
+
+    def iter_lines(self, headers, align_list, column_max, rows):
+        cell_tags = ['<td style="text-align: {}">{{}}</td>'.format(self._align_styles.get(al, 'left'))
+                     for al in align_list]
+        row_template = '<tr>{}</tr>'.format(''.join(cell_tags))
+
+        yield '<table>'
+        yield '<thead>'
+        yield '<tr>{}</tr>'.format(''.join('<th>{}</th>'.format(html.escape(str(h))) for h in headers))
+        yield '</thead>'
+        yield '<tbody>'
+        for row in rows:
+            yield row_template.format(*map(html.escape, row))
+
+        yield '</tbody>'
+        yield '</table>'
+
+
+class JsonWriter(TabWriter):
+    """
+    Writes the table as a `json` array of objects, with the headers as keys. Values
+        that are not `json` serializable are written as `str`.
+    """
+
+    text = False
+
+    def iter_lines(self, headers, align_list, column_max, rows):
+        yield '['
+        previous = None
+        for row in rows:
+            if previous is not None:
+                yield previous + ','
+
+            previous = json.dumps(dict(zip(headers, row)), default=str)
+
+        if previous is not None:
+            yield previous
+
+        yield ']'
+
+
+class JsonLinesWriter(TabWriter):
+    """
+    Writes the table as `json lines`, a `json` object per row.
+    """
+
+    text = False
+
+    def iter_lines(self, headers, align_list, column_max, rows):
+        for row in rows:
+            yield json.dumps(dict(zip(headers, row)), default=str)
+
+
+TabWriter.register('csv', CsvWriter)
+TabWriter.register('tsv', TsvWriter)
+TabWriter.register('markdown', MarkdownWriter)
+TabWriter.register('html', HtmlWriter)
+TabWriter.register('json', JsonWriter)
+TabWriter.register('jsonl', JsonLinesWriter)
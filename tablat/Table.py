@@ -1,10 +1,24 @@
 # -*- coding: utf-8 -*-
 import warnings
 import sys
+import threading
 import json
+import csv
+import mmap
 from pathlib import Path
-from io import StringIO
+from time import perf_counter
+from itertools import chain, islice
+from collections import deque, OrderedDict
+from operator import itemgetter
 from .TabStyle import TabStyle
+from .ColumnStore import ColumnStore
+from .TableView import TableView
+from .TabLayout import TabLayout
+from .JsonReader import JsonReader
+from .ArrayStore import ArrayStore
+from .TabWriter import TabWriter
+from .TabAppender import TabAppender
+from .TextWidth import TextWidth
 
 
 class Table(object):
@@ -21,126 +35,315 @@ class Table(object):
         style (tablat.TabStyle): Style object to define the aspect of the table.
             If style object is not provided, default style is applied.
             (Default style in `tablat.TabStyle` doc)
+        executor (concurrent.futures.Executor): Optional thread or process pool used
+            to calculate the column widths and to format the rows in `render_to`
+            and `print_table`, in chunks of rows. By default everything runs in
+            the current thread.
+        stats (tablat.TabStats): Optional timers and counters of the table operations.
+            By default `None` (disabled).
+
+    The data is kept by columns in a `tablat.ColumnStore`. Subclasses can replace
+        the storage setting `_store_class` to a class with the same interface.
     """
 
-    def __init__(self, table_data=None, headers=None, style=None):
-        self._table_data = table_data or []
+    __slots__ = ('_headers', '_num_columns', '_data_store', '_pending_data', '_version', '_render_cache',
+                 '_render_cache_size', '_cache_hits', '_cache_misses', '_colspace', '_write_batch',
+                 '_parallel_chunk', '_parallel_pending', '_layouts', '_layouts_size', '_append_state',
+                 '_row_indexes', '_column_widths', '_dirty_widths', '_width_limits', '_align_list',
+                 '_lock', 'style', 'executor', 'stats')
+
+    _store_class = ColumnStore
+
+    def __init__(self, table_data=None, headers=None, style=None, executor=None):
         self._headers = list(map(str, headers)) if headers else []
         self._num_columns = len(self._headers)
+        self._data_store = None
+        self._pending_data = table_data or []
+        self._version = 0
+        self._render_cache = OrderedDict()
+        self._render_cache_size = 32
+        self._cache_hits = 0
+        self._cache_misses = 0
         self._colspace = 3
-        self._column_max = []
+        self._write_batch = 1024
+        self._parallel_chunk = 10000
+        self._parallel_pending = 16
+        self._layouts = {}
+        self._layouts_size = 16
+        self._append_state = None
+        self._row_indexes = {}
+        self._column_widths = []
+        self._dirty_widths = set()
+        self._width_limits = {}
         self._align_list = []
+        self._lock = threading.RLock()
         self.style = style
+        self.executor = executor
+        self.stats = None
 
         # Init functions
-        self._calc_columns_max_lenght()
+        self._invalidate_widths()
         self._alignment_init()
         self._style_check()
 
     def __getitem__(self, i):
-        return self._table_data[i * self._num_columns:i * self._num_columns + self._num_columns]
+        return self._store.row(i)
 
-    def __str__(self):
+    def __getstate__(self):
+        # The lock can't be pickled, a new one is created by `__setstate__`
+        slots = chain.from_iterable(getattr(cls, '__slots__', ()) for cls in type(self).__mro__)
+        return {name: getattr(self, name) for name in slots if name != '_lock' and hasattr(self, name)}
 
-        # Modify stdout for str buffer
-        stdout_backup = sys.stdout
-        sys.stdout = StringIO()
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
 
-        # Generate table (printed to stdout) and restore stdout
-        self.print_table()
-        table_str = sys.stdout.getvalue()
-        sys.stdout.close()
-        sys.stdout = stdout_backup
+        self._lock = threading.RLock()
 
-        return table_str
+    def __str__(self):
+        return self.render()
 
     def __repr__(self):
         print('{\n\t"headers":{},\n\t"data":{},\n\n"columns_lenght":{}\n}'.format(self.headers,
                                                                                   self.table_data,
                                                                                   self._column_max))
 
-    def _calc_columns_max_lenght(self):
+    @property
+    def _store(self):
+        """
+        Storage of the table data. Data set with `table_data` is loaded in the store
+            the first time it is needed, under the lock so concurrent readers and
+            writers get the same store.
+        """
+        if self._pending_data is not None:
+            with self._lock:
+                if self._pending_data is not None:
+                    data = self._pending_data
+                    self._data_store = self._store_class(self._num_columns, data)
+                    self._pending_data = None
+                    if self.stats is not None:
+                        self.stats.count('cells_stringified', len(self._data_store))
+
+        return self._data_store
+
+    @_store.setter
+    def _store(self, store):
+        self._pending_data = None
+        self._data_store = store
+
+    @property
+    def _column_max(self):
         """
-        Calculates max lenght of each column based on data in `_table_data` and `_headers`
+        Max lenght of each column. Widths of the columns marked as dirty are calculated
+            the first time they are needed.
         """
-        if self._num_columns == 0:
-            return
+        if self._dirty_widths:
+            self._calc_columns_max_lenght(sorted(self._dirty_widths))
+
+        return self._column_widths
+
+    @_column_max.setter
+    def _column_max(self, column_max):
+        self._column_widths = list(column_max)
+        self._dirty_widths = set()
+
+    def _invalidate_widths(self, indexes=None):
+        """
+        Marks the widths of the columns in `indexes` (all by default) to be calculated
+            again when needed
+        """
+        num_columns = self._num_columns
+        self._column_widths = (self._column_widths + [0] * num_columns)[:num_columns]
+        self._dirty_widths.update(range(num_columns) if indexes is None else indexes)
+        self._dirty_widths.intersection_update(range(num_columns))
+        if indexes is None:
+            self._width_limits = {i: limit for i, limit in self._width_limits.items() if i < num_columns}
+
+    def _limit_width(self, index, width):
+        """
+        Return the width of a column limited by its declared width, if any
+        """
+        limit = self._width_limits.get(index)
+        if limit is None:
+            return width
+
+        max_width, fixed, _ = limit
+        return max_width if fixed else min(width, max_width)
+
+    def _calc_columns_max_lenght(self, indexes=None):
+        """
+        Calculates max lenght of the columns in `indexes` (all by default) based on
+            data in `_store` and `_headers`
+        """
+        start = perf_counter()
+        if indexes is None:
+            indexes = range(self._num_columns)
+            self._column_widths = [0] * self._num_columns
+
+        # Columns with a fixed width are never scanned
+        scan = [i for i in indexes if not self._width_limits.get(i, (0, False))[1]]
+        if self.executor is None:
+            widths = [self._store.text_width(i) for i in scan]
+        else:
+            widths = self._parallel_widths(scan)
 
-        column_max = []
-        for head in self._headers:
-            column_max.append(len(head))
+        data_widths = dict(zip(scan, widths))
+        for i in indexes:
+            self._column_widths[i] = self._limit_width(i, max(TextWidth.width(self._headers[i]), data_widths.get(i, 0)))
 
-        for i, data in enumerate(self._table_data):
-            if len(str(data)) > column_max[i % self._num_columns]:
-                column_max[i % self._num_columns] = len(str(data))
+        self._dirty_widths.difference_update(indexes)
+        if self.stats is not None:
+            seconds = perf_counter() - start
+            self.stats.add_time('widths', seconds)
+            self.stats.emit('widths', {'seconds': seconds, 'columns': list(indexes)})
 
-        self._column_max = column_max
+    def _parallel_widths(self, indexes):
+        """
+        Return the max lenght of the text of the columns in `indexes`, calculated with
+            `executor` as the max of each chunk of `_parallel_chunk` cells
+        """
+        store = self._store
+        futures = [[self.executor.submit(store.chunk_width, chunk)
+                    for chunk in store.text_chunks(i, self._parallel_chunk)]
+                   for i in indexes]
+
+        return [max((future.result() for future in column_futures), default=0) for column_futures in futures]
 
-    def _update_columns_max_lenght(self, data_list, start_index=0):
+    def _update_columns_max_lenght(self, text_list, start_index=0):
         """
-        Updates max lenght of columns from a data list.
+        Updates max lenght of columns from a list with the text of the cells.
         """
-        if self._num_columns == 0:
+        num_columns = self._num_columns
+        if num_columns == 0:
+            return
+
+        # Display widths are only needed if some text is not plain ASCII
+        joined = ''.join(text_list)
+        plain = joined.isascii() and '\x1b' not in joined
+        if len(text_list) == num_columns and start_index % num_columns == 0 and not self._dirty_widths:
+            # A single complete row
+            widths = self._column_widths
+            for col_index, width in enumerate(map(len if plain else TextWidth.width, text_list)):
+                if width > widths[col_index]:
+                    widths[col_index] = self._limit_width(col_index, width)
+
             return
 
-        for i, data in enumerate(data_list, start=start_index):
-            if len(str(data)) > self._column_max[i % self._num_columns]:
-                self._column_max[i % self._num_columns] = len(str(data))
+        for i in range(min(num_columns, len(text_list))):
+            col_index = (start_index + i) % num_columns
+            if col_index in self._dirty_widths:
+                continue
+
+            if plain:
+                data_max = max(map(len, text_list[i::num_columns]))
+            else:
+                data_max = TextWidth.max_width(text_list[i::num_columns])
+            if data_max > self._column_widths[col_index]:
+                self._column_widths[col_index] = self._limit_width(col_index, data_max)
+
+    def _data_changed(self):
+        """
+        Increases the data version of the table and drops the cached outputs
+        """
+        with self._lock:
+            self._version += 1
+            if self._render_cache:
+                self._render_cache.clear()
 
     def _style_check(self):
         if not self.style or not isinstance(self.style, TabStyle):
             self.style = TabStyle()
 
-    def _get_column_mask(self, show_columns, hide_columns):
+    def _columns_check(self):
         """
-        Return a boolean mask list. Each `bool` is associated with one column,
-            and indicates if that column must be displayed.
+        Return `True` if the table has columns to render, otherwise warns the user.
         """
+        if not self._num_columns:
+            warnings.warn("Unable to calculate the number of columns, you need"
+                          "to provide a 'headers' list to generate the table "
+                          "layout. Use headers attribute", UserWarning)
+            return False
+
+        return True
+
+    def _get_column_indexes(self, show_columns, hide_columns):
+        """
+        Return the sorted list of indexes of the columns that must be displayed.
+            Indexes out of range are ignored.
+        """
+        num_columns = self._num_columns
         if show_columns:
-            base_value = False
-            mark_value = True
-            col_list = show_columns
+            return sorted({i % num_columns for i in show_columns if -num_columns <= i < num_columns})
 
-        else:
-            base_value = True
-            mark_value = False
-            col_list = hide_columns or []
+        hidden = {i % num_columns for i in hide_columns or [] if -num_columns <= i < num_columns}
+        return [i for i in range(num_columns) if i not in hidden]
 
-        mask_list = [base_value] * self._num_columns
-        for col_ind in col_list:
-            try:
-                mask_list[col_ind] = mark_value
+    def _get_rows(self, indexes, rows=None, text=True, widths=True, row_index=None):
+        """
+        Return an iterator over the complete rows of the table, with the text (or the
+            values if `text` is `False`) of the cells of the columns in `indexes`,
+            limited to the `rows` slice. If `row_index` is provided only the rows
+            at those positions are returned. If `widths` is `True` column widths in
+            `_column_max` are up to date once this method returns.
+        """
+        if rows is not None and rows.step is not None and rows.step < 1:
+            raise ValueError('Invalid row slice, step must be positive: {}'.format(rows))
 
-            except IndexError:
-                pass
+        if row_index is not None:
+            positions = row_index if rows is None else row_index[rows]
+            return self._store.take(positions, indexes, text=text)
 
-        return mask_list
+        if rows is None:
+            return self._store.rows(indexes, text=text)
 
-    def _filter_list(self, list, mask):
+        start, stop, step = rows.indices(self._store.num_rows)
+        return self._store.rows(indexes, start, stop, step, text=text)
+
+    def _get_column_index(self, column):
         """
-        Return a filtered list based on a `bool` mask
+        Return the index of a column from its index or its header
         """
-        if len(list) != len(mask):
-            print('Unable to filter list. Returning all data')
-            return list[:]
+        if isinstance(column, str):
+            try:
+                return self._headers.index(column)
+
+            except ValueError:
+                raise ValueError('Unknown column: {}. Current headers: {}'.format(column, self._headers))
 
-        return [d for d, m in zip(list, mask) if m]
+        if not -self._num_columns <= column < self._num_columns:
+            raise IndexError('Invalid column index. Current number of columns: {}, index input: {}'.format(self._num_columns, column))
 
-    def _filter_table_data(self, mask):
+        return column % self._num_columns
+
+    def _find_rows(self, col_index, value):
         """
-        Return a list with the data correspondig to a certain columns based on a `bool` mask
+        Return the positions of the rows with `value` in a column. If the column has
+            a hash index it is updated with the new rows and used for the search.
         """
-        row_lenght = self._num_columns
-        start = 0
-        end = row_lenght
-        filt_data = []
+        if col_index not in self._row_indexes:
+            return self._store.find(col_index, value)
+
+        store, indexed_rows, positions = self._row_indexes[col_index]
+        if store is not self._store:
+            store, indexed_rows, positions = self._store, 0, {}
+
+        column = self._store.column(col_index)
+        for i in range(indexed_rows, self.num_rows):
+            positions.setdefault(column[i], []).append(i)
 
-        while end <= len(self._table_data):
-            filt_data.extend(self._filter_list(self._table_data[start:end], mask))
-            start = end
-            end += row_lenght
+        self._row_indexes[col_index] = (store, self.num_rows, positions)
+        return list(positions.get(value, []))
 
-        return filt_data
+    def _clear_row_indexes(self, keep=True):
+        """
+        Clears the content of the hash indexes when the data is replaced, they are
+            rebuilt by `_find_rows` when used. With `keep` set to `False` the
+            indexes are removed.
+        """
+        if keep:
+            self._row_indexes = {i: (None, 0, {}) for i in self._row_indexes}
+        else:
+            self._row_indexes = {}
 
     def _alignment_init(self):
         """
@@ -166,114 +369,766 @@ class Table(object):
         else:
             self._align_list.extend(['>'] * col_diff)
 
-    def _print_hsep(self, char='_', borders=' ', num_columns=None, column_max=None):
+    def _set_columns(self, headers, columns, texts=None, column_max=None, store_class=None):
         """
-        Print horizontal separator
+        Replace the headers and the content of the table with a list of columns.
+            The column lists are used by the store, not copied. If the max lenght
+            of the data in each column is known it can be provided in `column_max`.
         """
+        init_align = not bool(self._headers)
+        num_columns = self._num_columns
+        self._headers = list(map(str, headers))
+        self._num_columns = len(self._headers)
+        store = (store_class or self._store_class).from_columns(columns, texts)
+        with self._lock:
+            self._store = store
+            self._clear_row_indexes(num_columns == self._num_columns)
+            self._data_changed()
+        if self.stats is not None:
+            self.stats.count('cells_stringified', len(self._store))
+
+        if column_max is None:
+            self._invalidate_widths()
+        else:
+            self._column_max = [self._limit_width(i, max(TextWidth.width(h), m))
+                                for i, (h, m) in enumerate(zip(self._headers, column_max))]
 
-        num_columns = self._num_columns if not num_columns else num_columns
-        column_max = self._column_max if not column_max else column_max
-        add_lenght = self._colspace * 2
-        if self.style.col_sep:
-            add_lenght += (num_columns -1) * (round(self._colspace / 2) * 2 + 1)
+        if init_align:
+            self._alignment_init()
         else:
-            add_lenght += (num_columns - 1) * self._colspace
+            self._adjust_alignment()
+
+    def _get_headers(self, indexes):
+        """
+        Return the headers of the columns in `indexes`, cut to the declared widths
+        """
+        return next(iter(self._clip_rows(indexes, [[self._headers[i] for i in indexes]])))
+
+    def _clip_rows(self, indexes, rows):
+        """
+        Return the rows with the text of the cells longer than the declared width of
+            their column cut, following the overflow mode of the column. The rows are
+            returned unchanged if no column in `indexes` has a declared width.
+        """
+        limits = [(pos, self._column_max[i], self._width_limits[i][2] == 'ellipsis')
+                  for pos, i in enumerate(indexes) if i in self._width_limits]
+        if not limits:
+            return rows
+
+        clip_text = TextWidth.clip
+
+        def clip(row):
+            row = list(row)
+            for pos, width, ellipsis in limits:
+                if len(row[pos]) > width or not row[pos].isascii():
+                    row[pos] = clip_text(row[pos], width, '…' if ellipsis else '')
 
-        print('{b}{l}{b}'.format(b=borders, l=char*(sum(column_max) + add_lenght)))
+            return row
 
-    def print_table(self, show_columns=None, hide_columns=None):
+        return map(clip, rows)
+
+    def _get_layout(self, indexes):
+        """
+        Return the compiled `TabLayout` for the columns in `indexes`. Layouts are
+            cached while the style, widths and alignments don't change.
+        """
+        align_list = tuple(self._align_list[i] for i in indexes)
+        column_max = tuple(self._column_max[i] for i in indexes)
+        key = (self.style.borders, self.style.row_sep, self.style.col_sep, column_max, align_list)
+
+        layout = self._layouts.get(key)
+        if layout is None:
+            if len(self._layouts) >= self._layouts_size:
+                self._layouts.clear()
+
+            layout = TabLayout(self.style, column_max, align_list, self._colspace)
+            self._layouts[key] = layout
+
+        return layout
+
+    def _iter_lines(self, indexes, rows=None, row_index=None):
+        """
+        Generates the lines of the table with the columns in `indexes` and the rows
+            in the `rows` slice (of `row_index` positions, if provided)
+        """
+        if not self._columns_check():
+            return
+
+        # Rows are requested first, so widths are up to date. The lock keeps rows
+        # and widths consistent while other threads add data.
+        self._style_check()
+        with self._lock:
+            rows = self._clip_rows(indexes, self._get_rows(indexes, rows, row_index=row_index))
+            layout = self._get_layout(indexes)
+            headers = self._get_headers(indexes)
+
+        yield from layout.iter_lines(headers, self._count_rows(rows))
+
+    def _write_table(self, fp, indexes, rows=None, row_index=None):
+        """
+        Writes the table with the columns in `indexes` and the rows in the `rows`
+            slice (of `row_index` positions, if provided) to a text stream. With an
+            `executor` the rows are formatted in chunks by the pool and written in
+            order, with at most `_parallel_pending` chunks waiting to be written.
+        """
+        if self.executor is None:
+            self._write_lines(fp, self._iter_lines(indexes, rows, row_index))
+            return
+
+        if not self._columns_check():
+            return
+
+        self._style_check()
+        with self._lock:
+            rows = self._count_rows(self._clip_rows(indexes, self._get_rows(indexes, rows, row_index=row_index)))
+            layout = self._get_layout(indexes)
+            headers = self._get_headers(indexes)
+
+        self._write_lines(fp, layout.header_lines(headers))
+
+        pending = deque()
+        for chunk in iter(lambda: list(islice(rows, self._parallel_chunk)), []):
+            if len(pending) >= self._parallel_pending:
+                self._write_chunk(fp, pending.popleft().result())
+
+            pending.append(self.executor.submit(layout.format_rows, chunk))
+
+        while pending:
+            self._write_chunk(fp, pending.popleft().result())
+
+        if layout.bottom is not None:
+            self._write_lines(fp, [layout.bottom])
+
+    def _export(self, fp, output_format, indexes, rows=None, row_index=None):
+        """
+        Writes the columns in `indexes` and the rows in the `rows` slice (of `row_index`
+            positions, if provided) with a `TabWriter`
+        """
+        writer = TabWriter.get(output_format)
+        if not self._columns_check():
+            return
+
+        with self._lock:
+            rows = self._count_rows(self._get_rows(indexes, rows, writer.text, writer.widths, row_index))
+            column_max = [self._column_max[i] for i in indexes] if writer.widths else None
+
+        lines = writer.iter_lines([self._headers[i] for i in indexes],
+                                  [self._align_list[i] for i in indexes], column_max, rows)
+        self._write_lines(fp, lines)
+
+    def _write_lines(self, fp, lines):
+        """
+        Writes lines to a text stream, joined in chunks of `_write_batch` lines
+            to keep the number of `write` calls low.
+        """
+        for chunk in self._iter_chunks(lines):
+            self._write_chunk(fp, chunk)
+
+    def _write_chunk(self, fp, chunk):
+        """
+        Writes a `str` to a text stream, adding the time and size to `stats` if enabled
+        """
+        if self.stats is None:
+            fp.write(chunk)
+            return
+
+        start = perf_counter()
+        fp.write(chunk)
+        self.stats.add_time('write', perf_counter() - start)
+        self.stats.count('chars_written', len(chunk))
+
+    def _count_rows(self, rows):
+        """
+        Return the rows, counted in `stats` while they are consumed if enabled
+        """
+        if self.stats is None:
+            return rows
+
+        return self._iter_counted(rows, self.stats)
+
+    @staticmethod
+    def _iter_counted(rows, stats):
+        """
+        Generates the rows and adds the number of rows generated to `stats` at the end
+        """
+        num_rows = 0
+        try:
+            for num_rows, row in enumerate(rows, 1):
+                yield row
+
+        finally:
+            stats.count('rows_rendered', num_rows)
+
+    def _measure(self, event, function, *args):
+        """
+        Calls `function` with `args` and returns its result. If `stats` is enabled
+            the call is recorded as an operation named `event`.
+        """
+        if self.stats is None:
+            return function(*args)
+
+        mark = self.stats.start()
+        result = function(*args)
+        self.stats.finish(event, mark)
+        return result
+
+    def _render_text(self, indexes, rows=None, row_index=None):
+        """
+        Return the table with the columns in `indexes` and the rows in the `rows` slice
+            (of `row_index` positions, if provided) as a `str`
+        """
+        output = self._join_lines(self._iter_lines(indexes, rows, row_index))
+        if self.stats is not None:
+            self.stats.count('chars_written', len(output))
+
+        return output
+
+    def _iter_chunks(self, lines):
+        """
+        Generates `str` chunks with `_write_batch` lines, each line ended with a line break
+        """
+        batch = []
+        for line in lines:
+            batch.append(line)
+            if len(batch) >= self._write_batch:
+                batch.append('')
+                yield '\n'.join(batch)
+                batch = []
+
+        if batch:
+            batch.append('')
+            yield '\n'.join(batch)
+
+    async def _acalc_widths(self):
+        """
+        Calculates the widths of the dirty columns in chunks of `_parallel_chunk` cells,
+            returning the control to the event loop after each chunk. If the data
+            changes meanwhile the widths are left to be calculated when used.
+        """
+        import asyncio
+
+        version = self._version
+        store = self._store
+        widths = {}
+        for i in sorted(self._dirty_widths):
+            width = TextWidth.width(self._headers[i])
+            if not self._width_limits.get(i, (0, False))[1]:
+                for chunk in store.text_chunks(i, self._parallel_chunk):
+                    width = max(width, store.chunk_width(chunk))
+                    await asyncio.sleep(0)
+
+            widths[i] = width
+
+        with self._lock:
+            if self._version == version and self._store is store:
+                for i, width in widths.items():
+                    self._column_widths[i] = self._limit_width(i, width)
+
+                self._dirty_widths.difference_update(widths)
+
+    async def _arender(self, indexes, rows=None, row_index=None):
+        """
+        Generates the chunks of the table asynchronously, returning the control to
+            the event loop after each chunk
+        """
+        import asyncio
+
+        if self._dirty_widths:
+            await self._acalc_widths()
+
+        for chunk in self._iter_chunks(self._iter_lines(indexes, rows, row_index)):
+            yield chunk
+            await asyncio.sleep(0)
+
+    @staticmethod
+    async def _write_async(writer, chunks, encoding=None):
+        """
+        Writes the chunks of an async generator to a writer. Coroutine `write` methods
+            are awaited and `drain` is awaited after each chunk if the writer has it.
+        """
+        import asyncio
+        import inspect
+
+        if encoding is None and isinstance(writer, asyncio.StreamWriter):
+            encoding = 'utf-8'
+
+        drain = getattr(writer, 'drain', None)
+        async for chunk in chunks:
+            result = writer.write(chunk.encode(encoding) if encoding else chunk)
+            if inspect.isawaitable(result):
+                await result
+
+            if drain is not None:
+                await drain()
+
+    @staticmethod
+    def _join_lines(lines):
+        """
+        Return a `str` with the lines, each one ended with a line break
+        """
+        lines = list(lines)
+        if not lines:
+            return ''
+
+        lines.append('')
+        return '\n'.join(lines)
+
+    def iter_lines(self, show_columns=None, hide_columns=None, rows=None):
+        """
+        Generates the lines of the table lazily, one `str` per line without
+            the line break.
+
+        Args:
+            show_columns (list): Indexes of the columns to show (see `print_table`).
+            hide_columns (list): Indexes of the columns to hide (see `print_table`).
+            rows (slice): Rows to print, like `slice(100, 200)`. Column widths are
+                the same as in the whole table. By default all rows are printed.
+
+        Returns:
+            iterator: The lines of the table.
+        """
+        return self._iter_lines(self._get_column_indexes(show_columns, hide_columns), rows)
+
+    def render_to(self, fp, show_columns=None, hide_columns=None, rows=None):
+        """
+        Writes the table to a text stream in buffered chunks. If the table has an
+            `executor` the rows are formatted in parallel.
+
+        Args:
+            fp: Any object with a `write(str)` method (file, `io.StringIO`,
+                `sys.stdout`...).
+            show_columns (list): Indexes of the columns to show (see `print_table`).
+            hide_columns (list): Indexes of the columns to hide (see `print_table`).
+            rows (slice): Rows to print, like `slice(100, 200)`. Column widths are
+                the same as in the whole table. By default all rows are printed.
+        """
+        self._measure('render', self._write_table, fp, self._get_column_indexes(show_columns, hide_columns), rows)
+
+    def render(self, show_columns=None, hide_columns=None, rows=None):
+        """
+        Returns the table as a `str`.
+
+        Args:
+            show_columns (list): Indexes of the columns to show (see `print_table`).
+            hide_columns (list): Indexes of the columns to hide (see `print_table`).
+            rows (slice): Rows to print, like `slice(100, 200)`. Column widths are
+                the same as in the whole table. By default all rows are printed.
+
+        Returns:
+            str: The rendered table, each line ended with a line break.
+        """
+        indexes = self._get_column_indexes(show_columns, hide_columns)
+        if not self._render_cache_size:
+            return self._measure('render', self._render_text, indexes, rows)
+
+        self._style_check()
+        row_key = None if rows is None else (rows.start, rows.stop, rows.step)
+        with self._lock:
+            key = (self._version, self.style, self.style._version, self._colspace, tuple(indexes), row_key)
+            output = self._render_cache.get(key)
+            if output is not None:
+                self._cache_hits += 1
+                if self.stats is not None:
+                    self.stats.count('cache_hits')
+
+                self._render_cache.move_to_end(key)
+                return output
+
+            self._cache_misses += 1
+            if self.stats is not None:
+                self.stats.count('cache_misses')
+
+        # Rendered outside the lock, an output of old data is stored with its old version
+        output = self._measure('render', self._render_text, indexes, rows)
+        with self._lock:
+            self._render_cache[key] = output
+            while len(self._render_cache) > self._render_cache_size:
+                self._render_cache.popitem(last=False)
+
+        return output
+
+    def cache_info(self):
+        """
+        Return the statistics of the cache of rendered outputs. `render()` (and
+            `str(table)`) keeps the last outputs while the data, headers, alignment
+            and style of the table don't change.
+
+        Returns:
+            dict: Number of `hits` and `misses`, current `size` and `max_size`
+                of the cache.
+        """
+        return {'hits': self._cache_hits, 'misses': self._cache_misses,
+                'size': len(self._render_cache), 'max_size': self._render_cache_size}
+
+    def print_table(self, show_columns=None, hide_columns=None, rows=None):
         """
         Prints a table with the data.
 
         Args:
             show_columns (list): Indexes of the columns to show. This list
                 have priority over `hide_columns`.
-            hide_columns (list): Incexes of the columns to hide when printing.
+            hide_columns (list): Indexes of the columns to hide when printing.
                 If `show_columns` list is provided this list is ignored.
+            rows (slice): Rows to print, like `slice(100, 200)`. Column widths are
+                the same as in the whole table. By default all rows are printed.
         """
+        self.render_to(sys.stdout, show_columns, hide_columns, rows)
 
-        if not self._num_columns:
-            warnings.warn("Unable to calculate the number of columns, you need"
-                          "to provide a 'headers' list to generate the table "
-                          "layout. Use headers attribute", UserWarning)
-            return
+    def arender(self, show_columns=None, hide_columns=None, rows=None):
+        """
+        Generates the table asynchronously in `str` chunks of `_write_batch` lines,
+            so big tables don't block the event loop while they are rendered:
+            `async for chunk in table.arender(): ...`
+            Column widths not calculated yet are calculated in chunks too. A
+            `StreamTable` reads its width sample before the first chunk.
+
+        Args:
+            show_columns (list): Indexes of the columns to show (see `print_table`).
+            hide_columns (list): Indexes of the columns to hide (see `print_table`).
+            rows (slice): Rows to print, like `slice(100, 200)`. Column widths are
+                the same as in the whole table. By default all rows are printed.
+
+        Returns:
+            async iterator: The chunks of the table, each line ended with a line break.
+        """
+        return self._arender(self._get_column_indexes(show_columns, hide_columns), rows)
+
+    async def render_to_async(self, writer, show_columns=None, hide_columns=None, rows=None, encoding=None):
+        """
+        Writes the table to an asynchronous writer in chunks (see `arender`).
+
+        Args:
+            writer: Object with a `write` method, a regular method or a coroutine. If the
+                writer has a `drain` coroutine (like `asyncio.StreamWriter`) it is
+                awaited after each chunk.
+            show_columns (list): Indexes of the columns to show (see `print_table`).
+            hide_columns (list): Indexes of the columns to hide (see `print_table`).
+            rows (slice): Rows to print, like `slice(100, 200)`. Column widths are
+                the same as in the whole table. By default all rows are printed.
+            encoding (str): Encoding of the chunks for writers of `bytes`. By default
+                `utf-8` for an `asyncio.StreamWriter`, otherwise `str` chunks are written.
+        """
+        await self._write_async(writer, self.arender(show_columns, hide_columns, rows), encoding)
+
+    def _render_partial(self, rows, footer, show_columns, hide_columns):
+        """
+        Return the rendered rows in the `rows` slice followed by a `footer` line
+        """
+        table_str = self.render(show_columns, hide_columns, rows)
+        if footer:
+            table_str += footer + '\n'
+
+        return table_str
+
+    def export(self, fp, output_format='csv', show_columns=None, hide_columns=None, rows=None):
+        """
+        Writes the table to a text stream in another format, in buffered chunks.
+            Column widths are not needed by these formats.
+
+        Args:
+            fp: Any object with a `write(str)` method.
+            output_format (str or tablat.TabWriter): One of `csv`, `tsv`, `markdown`
+                (GitHub flavored), `html`, `json` or `jsonl` (json lines), or any
+                format registered with `TabWriter.register`. Default value `'csv'`
+            show_columns (list): Indexes of the columns to show (see `print_table`).
+            hide_columns (list): Indexes of the columns to hide (see `print_table`).
+            rows (slice): Rows to write. By default all rows are written.
+        """
+        self._measure('export', self._export, fp, output_format,
+                      self._get_column_indexes(show_columns, hide_columns), rows)
+
+    def head(self, num_rows=10, show_columns=None, hide_columns=None):
+        """
+        Returns the first rows of the table as a `str`. If there are more rows
+            a last line `... N more rows` is added.
+
+        Args:
+            num_rows (int): Number of rows to render. Default value `10`
+            show_columns (list): Indexes of the columns to show (see `print_table`).
+            hide_columns (list): Indexes of the columns to hide (see `print_table`).
+
+        Returns:
+            str: The rendered rows.
+        """
+        hidden = max(self.num_rows - num_rows, 0)
+        footer = '... {} more rows'.format(hidden) if hidden else ''
+        return self._render_partial(slice(0, num_rows), footer, show_columns, hide_columns)
+
+    def tail(self, num_rows=10, show_columns=None, hide_columns=None):
+        """
+        Returns the last rows of the table as a `str`. If there are previous rows
+            a last line `... N more rows` is added.
+
+        Args:
+            num_rows (int): Number of rows to render. Default value `10`
+            show_columns (list): Indexes of the columns to show (see `print_table`).
+            hide_columns (list): Indexes of the columns to hide (see `print_table`).
+
+        Returns:
+            str: The rendered rows.
+        """
+        hidden = max(self.num_rows - num_rows, 0)
+        footer = '... {} more rows'.format(hidden) if hidden else ''
+        return self._render_partial(slice(hidden, None), footer, show_columns, hide_columns)
+
+    def page(self, page_number, page_size=20, show_columns=None, hide_columns=None):
+        """
+        Returns a page of the table as a `str`. Pages are numbered from 0 and the
+            column widths are the same for all pages, so they line up.
+
+        Args:
+            page_number (int): Number of the page to render, `0` or greater.
+            page_size (int): Number of rows in each page. Default value `20`
+            show_columns (list): Indexes of the columns to show (see `print_table`).
+            hide_columns (list): Indexes of the columns to hide (see `print_table`).
+
+        Returns:
+            str: The rendered page.
+        """
+        if page_number < 0:
+            raise ValueError('Invalid page number: {}. Pages are numbered from 0'.format(page_number))
+
+        start = page_number * page_size
+        hidden = max(self.num_rows - start - page_size, 0)
+        footer = '... {} more rows'.format(hidden) if hidden else ''
+        return self._render_partial(slice(start, start + page_size), footer, show_columns, hide_columns)
+
+    def render_new(self, fp=None, show_columns=None, hide_columns=None):
+        """
+        Writes only the rows added since the last call, to follow a table that keeps
+            growing (like `tail -f`). The first call writes the headers and all the rows,
+            the bottom border is never written. When a column width grows the headers
+            are written again before the new rows or, if `fp` is a terminal, the whole
+            table is redrawn in place.
+
+        Args:
+            fp: Any object with a `write(str)` method. By default `sys.stdout`
+            show_columns (list): Indexes of the columns to show (see `print_table`).
+            hide_columns (list): Indexes of the columns to hide (see `print_table`).
+
+        Returns:
+            int: The number of rows written.
+        """
+        if not self._columns_check():
+            return 0
 
-        # Init style vars
+        fp = fp or sys.stdout
         self._style_check()
-        col_space = ' ' * self._colspace
-        h_borders = ''
-        if self.style.col_sep:
-            col_space = '{s}{sep}{s}'.format(s=' '*round(self._colspace / 2), sep='|')
-
-        if self.style.borders:
-            h_borders = '|'
-
-        # Check columns to show
-        mask = self._get_column_mask(show_columns, hide_columns)
-        align_list = self._filter_list(self._align_list, mask)
-        headers = self._filter_list(self._headers, mask)
-        num_columns = len(headers)
-        column_max = self._filter_list(self._column_max, mask)
-        table_data = self._filter_table_data(mask)
-
-        # Print separator line
-        if self.style.borders:
-            self._print_hsep(num_columns=num_columns, column_max=column_max)
-        else:
-            print()
+        indexes = self._get_column_indexes(show_columns, hide_columns)
+        with self._lock:
+            store = self._store
+            num_rows = self.num_rows
+            layout = self._get_layout(indexes)
+
+        state = self._append_state
+        lines = []
+
+        # Starts again if the data was replaced
+        if state is None or state['store'] is not store or state['indexes'] != indexes or state['row'] > num_rows:
+            start = 0
+            screen_lines = 0
+            lines.extend(layout.header_lines(self._get_headers(indexes)))
+
+        elif state['layout'] != (layout._row_template, layout.header_sep):
+            isatty = getattr(fp, 'isatty', None)
+            if isatty is not None and isatty():
+                fp.write('\x1b[{}F\x1b[J'.format(state['lines']))
+                start = 0
+                screen_lines = 0
 
-        # Print headers
-        if num_columns == 1:
-            headers_line = '{b}{s}{d:{al}{l}}{s}{b}'.format(b=h_borders, s=' '*self._colspace, d=headers[0],
-                                                            al=align_list[0], l=column_max[0])
+            else:
+                start = state['row']
+                screen_lines = state['lines']
+                lines.append('')
+
+            lines.extend(layout.header_lines(self._get_headers(indexes)))
 
         else:
-            headers_line = '{b}{s}{d:{al}{l}}{sep}'.format(b=h_borders, s=' '*self._colspace, d=headers[0],
-                                                           al=align_list[0], l=column_max[0], sep=col_space)
+            start = state['row']
+            screen_lines = state['lines']
+
+        lines.extend(layout.row_lines(self._clip_rows(indexes, self._get_rows(indexes, slice(start, num_rows)))))
+        self._write_lines(fp, lines)
+        self._append_state = {
+            'store': store,
+            'indexes': indexes,
+            'layout': (layout._row_template, layout.header_sep),
+            'row': num_rows,
+            'lines': screen_lines + len(lines)
+        }
+
+        return num_rows - start
+
+    def view(self, show_columns=None, hide_columns=None):
+        """
+        Return a view of the table with a subset of its columns. The view shares
+            the table data, so it can be rendered many times with no copies.
 
-            for (col_lenght, header, align) in zip(column_max[1:-1], headers[1:-1], align_list[1:-1]):
-                headers_line += '{d:{al}{l}}{sep}'.format(l=col_lenght, al=align, d=header, sep=col_space)
+        Args:
+            show_columns (list): Indexes of the columns to show (see `print_table`).
+            hide_columns (list): Indexes of the columns to hide (see `print_table`).
 
-            headers_line += '{d:{al}{l}}{s}{b}'.format(b=h_borders, s=' '*self._colspace, d=headers[-1],
-                                                       al=align_list[-1], l=column_max[-1], sep=col_space)
+        Returns:
+            tablat.TableView: The view of the table.
+        """
+        return TableView(self, show_columns, hide_columns)
 
-        print(headers_line)
-        self._print_hsep('=' if self.style.row_sep else '-', h_borders, num_columns, column_max)
+    @classmethod
+    def from_numpy(cls, array, headers=None, style=None):
+        """
+        Create a table from a `numpy` array, each column of the array is a column
+            of the table. The columns are kept as arrays (views of `array`), and
+            the text and widths of the cells are calculated with `numpy` string
+            operations. Requires `numpy`.
 
-        # Print lines
-        for i, data in enumerate(table_data):
-            column_index = i % num_columns
-            row_completed = False
+        Args:
+            array (numpy.ndarray): A 2 dimensions array, or 1 dimension for a single
+                column table.
+            headers (list): Title of each column. By default the column indexes.
+            style (tablat.TabStyle): Style object to define the aspect of the table.
 
-            # Generate table rows
-            if num_columns == 1:
-                data_line = data_line = '{b}{s}{d:{al}{l}}{s}{b}'.format(b=h_borders, s=' '*self._colspace,
-                                                                         d=data, al=align_list[column_index],
-                                                                         l=column_max[column_index])
-                row_completed = True
+        Returns:
+            tablat.Table: The new table.
+        """
+        columns = ArrayStore.split_columns(array)
+        headers = headers if headers is not None else range(len(columns))
 
-            elif column_index == 0:
-                data_line = '{b}{s}{d:{al}{l}}{sep}'.format(b=h_borders, s=' '*self._colspace,
-                                                            d=data, al=align_list[column_index],
-                                                            sep=col_space, l=column_max[column_index])
+        table = cls(style=style)
+        table._set_columns(headers, columns, store_class=ArrayStore)
+        return table
 
-            elif column_index < num_columns - 1:
-                data_line += '{d:{al}{l}}{sep}'.format(d=data, al=align_list[column_index],
-                                                       l=column_max[column_index], sep=col_space)
+    @classmethod
+    def from_dataframe(cls, dataframe, style=None):
+        """
+        Create a table from a `pandas.DataFrame`, the columns of the data frame are
+            the columns of the table. The columns are kept as `numpy` arrays, like
+            in `from_numpy`. Requires `pandas`.
 
-            else:
-                data_line += '{d:{al}{l}}{s}{b}'.format(d=data, al=align_list[column_index],
-                                                        l=column_max[column_index], s=' '*self._colspace, b=h_borders)
-                row_completed = True
+        Args:
+            dataframe (pandas.DataFrame): The data of the table.
+            style (tablat.TabStyle): Style object to define the aspect of the table.
+
+        Returns:
+            tablat.Table: The new table.
+        """
+        columns = [dataframe.iloc[:, i].to_numpy() for i in range(dataframe.shape[1])]
+
+        table = cls(style=style)
+        table._set_columns(dataframe.columns, columns, store_class=ArrayStore)
+        return table
+
+    @staticmethod
+    def _fetch_batches(cursor, batch_size):
+        """
+        Generates the batches of rows of a DB-API cursor, fetched with `fetchmany`
+        """
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
 
-            # Manage end of row
-            if row_completed:
-                print(data_line)
-                if self.style.row_sep:
-                    self._print_hsep('-', h_borders, num_columns, column_max)
+            yield rows
 
-        if self.style.borders:
-            self._print_hsep(borders='|', num_columns=num_columns, column_max=column_max)
+    @classmethod
+    def from_cursor(cls, cursor, batch_size=1000, style=None):
+        """
+        Create a table from the result of a query in a DB-API cursor (`sqlite3`,
+            `psycopg2`...). The headers are the column names in `cursor.description`
+            and the rows are fetched with `fetchmany` and added in batches.
+
+        Args:
+            cursor: A DB-API cursor with an executed query.
+            batch_size (int): Number of rows fetched and added at once.
+                Default value `1000`
+            style (tablat.TabStyle): Style object to define the aspect of the table.
+
+        Returns:
+            tablat.Table: The new table.
+        """
+        table = cls(headers=[column[0] for column in cursor.description], style=style)
+        for rows in cls._fetch_batches(cursor, batch_size):
+            table.add_data(list(chain.from_iterable(rows)))
+
+        return table
+
+    @classmethod
+    async def from_async_iter(cls, rows, headers, batch_size=1000, style=None):
+        """
+        Create a table from an async iterable of rows (`async for row in rows`).
+            Rows are added in batches, short rows are filled with empty cells and
+            extra cells are ignored.
+
+        Args:
+            rows: An async iterable of rows, each row an iterable with the data of
+                each column.
+            headers (list): Title of each column in the table.
+            batch_size (int): Number of rows added at once. Default value `1000`
+            style (tablat.TabStyle): Style object to define the aspect of the table.
+
+        Returns:
+            tablat.Table: The new table.
+        """
+        table = cls(headers=headers, style=style)
+        num_columns = table._num_columns
+        batch = []
+        async for row in rows:
+            row = list(row)[:num_columns]
+            if len(row) < num_columns:
+                row.extend([''] * (num_columns - len(row)))
+
+            batch.extend(row)
+            if len(batch) >= batch_size * num_columns:
+                table.add_data(batch)
+                batch = []
+
+        if batch:
+            table.add_data(batch)
+
+        return table
+
+    def sort_by(self, column, reverse=False):
+        """
+        Return a view of the table with the rows sorted by the values of a column.
+            The view shares the table data, only the order of the rows is stored.
+
+        Args:
+            column (int or str): Index or header of the column.
+            reverse (bool): `True` to sort in descending order.
+
+        Returns:
+            tablat.TableView: The sorted view.
+        """
+        return TableView(self).sort_by(column, reverse)
+
+    def where(self, column_or_predicate, value=None):
+        """
+        Return a view of the table with the rows that match a condition: a column
+            equal to a value (`table.where('COUNTRY', 'Spain')`) or a function that
+            receives a row and returns `True` for the rows to keep. The view shares
+            the table data, only the positions of the rows are stored.
+
+        Args:
+            column_or_predicate (int, str or callable): Index or header of the column
+                to compare, or a function to filter the rows.
+            value: Value to find in the column.
+
+        Returns:
+            tablat.TableView: The filtered view.
+        """
+        return TableView(self).where(column_or_predicate, value)
+
+    def create_index(self, column):
+        """
+        Create a hash index for a column, used by `where` to find the rows with a
+            value without scanning the column. The index is updated when rows are
+            added. Column values must be hashable.
+
+        Args:
+            column (int or str): Index or header of the column.
+        """
+        col_index = self._get_column_index(column)
+        self._row_indexes[col_index] = (self._store, 0, {})
+        self._find_rows(col_index, None)
 
     def set_column_content(self, data_dict):
         """
@@ -288,23 +1143,8 @@ class Table(object):
             Returns:
                 tablat.Table: Returns the Table (self).
         """
-        self.headers = list(data_dict.keys())
-        self.table_data = []
-
-        # Check longest column
-        max_lenght = 0
-        for column_data in data_dict.values():
-            if len(column_data) > max_lenght:
-                max_lenght = len(column_data)
-
-        # Add data to table
-        for i in range(max_lenght):
-            row_data = []
-            for column_data in data_dict.values():
-                row_data.append(column_data[i] if i < len(column_data) else '')
-
-            self.add_data(row_data)
-
+        columns = [list(column_data) for column_data in data_dict.values()]
+        self._set_columns(data_dict.keys(), columns)
         return self
 
     def get_column_content(self):
@@ -321,25 +1161,74 @@ class Table(object):
         if not self.headers:
             return {}
 
+        column_indexes = {}
+        for i, header in enumerate(self.headers):
+            column_indexes.setdefault(header, []).append(i)
+
         column_dict = {}
-        for header in self.headers:
-            column_dict[header] = []
+        for header, indexes in column_indexes.items():
+            if len(indexes) == 1:
+                column_dict[header] = list(self._store.column(indexes[0]))
+                continue
 
-        for i, data in enumerate(self.table_data):
-            col_index = i % self._num_columns
-            column_dict[self.headers[col_index]].append(data)
+            # Columns with the same title are merged in row order
+            columns = [self._store.column(i) for i in indexes]
+            merged = [None] * sum(map(len, columns))
+            for i, column in enumerate(columns):
+                merged[i::len(columns)] = column
+
+            column_dict[header] = merged
 
         return column_dict
 
-    def load_data(self, file):
+    def load_data(self, file, chunk_size=1 << 20):
         """
         Set the table content from a `json` file. The `json` object must contain
             keys corresponding to the name of the columns. The values associated to this
             keys should be a list with the content of that column:
             `{'col_name1': [it11, it12, it13], 'col_name2: [it21, it22, it23]}`
 
+            The file is parsed incrementally and each column is stored as it is read,
+            so the memory used is close to the size of the final table.
+
+            Args:
+                file (str or pathlib.Path): The path to the `json` file in the system
+                chunk_size (int): Number of characters read from the file each time.
+
+            Returns:
+                tablat.Table: Returns the Table (self)
+        """
+        file_path = Path(file)
+        if not file_path.exists():
+            raise IOError('File not found: {}'.format(file_path.resolve()))
+
+        headers, columns, texts, column_max = [], [], [], []
+        with open(file_path, 'r') as f:
+            for header, items in JsonReader(f, chunk_size).iter_columns():
+                column = list(items)
+                column_texts = list(map(str, column))
+                headers.append(header)
+                columns.append(column)
+                texts.append(column_texts)
+                column_max.append(TextWidth.max_width(column_texts))
+
+        self._set_columns(headers, columns, texts, column_max)
+        return self
+
+    def load_jsonl(self, file, headers=None, batch_size=1000):
+        """
+        Set the table content from a `json lines` file, with one row per line. Rows
+            can be `json` objects, with the column names as keys, or arrays with the
+            content of each column. If `headers` are not provided they are taken
+            from the keys of the first object, or from the first array.
+
+            Rows are added in batches of `batch_size` rows while the file is read.
+
             Args:
-                data_dict (str or pathlib.Path): The path to the `json` file in the system
+                file (str or pathlib.Path): The path to the `json lines` file in the system
+                headers (list): Names of the columns. When rows are objects only
+                    these keys are loaded.
+                batch_size (int): Number of rows added to the table at once.
 
             Returns:
                 tablat.Table: Returns the Table (self)
@@ -349,20 +1238,162 @@ class Table(object):
             raise IOError('File not found: {}'.format(file_path.resolve()))
 
         with open(file_path, 'r') as f:
-            table_data = json.load(f)
+            rows = (json.loads(line) for line in f if line.strip())
+            first_row = next(rows, None)
+            if first_row is not None and (headers or isinstance(first_row, dict)):
+                rows = chain([first_row], rows)
 
-        return self.set_column_content(table_data)
+            if isinstance(first_row, dict):
+                headers = list(headers or first_row.keys())
+
+            else:
+                headers = list(headers or first_row or [])
+
+            self._set_columns(headers, [[] for _ in headers])
+            num_columns = self._num_columns
+            batch = []
+            for row in rows:
+                if isinstance(row, dict):
+                    batch.extend(row.get(header, '') for header in headers)
+
+                else:
+                    batch.extend(row[:num_columns])
+                    batch.extend([''] * (num_columns - len(row)))
+
+                if len(batch) >= batch_size * num_columns:
+                    self.add_data(batch)
+                    batch = []
+
+            self.add_data(batch)
+
+        return self
+
+    @staticmethod
+    def _read_lines(file_path, encoding, use_mmap):
+        """
+        Generates the lines of a text file, read with a big buffer or through `mmap`
+        """
+        if not use_mmap or file_path.stat().st_size == 0:
+            with open(file_path, 'r', encoding=encoding, newline='', buffering=1 << 20) as f:
+                yield from f
+
+            return
+
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b''):
+                yield line.decode(encoding)
+
+    def load_csv(self, file, delimiter=',', header=None, columns=None, encoding='utf-8',
+                 use_mmap=False, batch_size=10000):
+        """
+        Set the table content from a `csv` file (or `tsv` with `delimiter='\\t'`).
+            Rows are read in batches of `batch_size` rows and stored by columns,
+            calculating column widths at the same time.
+
+            Args:
+                file (str or pathlib.Path): The path to the `csv` file in the system
+                delimiter (str): Character used to separate the fields. Default value `','`
+                header (bool): `True` if the first row contains the column names. By
+                    default it is detected from the start of the file. Without header
+                    the columns are named with their index.
+                columns (list): Indexes or names of the columns to load, to keep in
+                    memory only the columns that will be displayed. By default all
+                    columns are loaded.
+                encoding (str): Encoding of the file. Default value `'utf-8'`
+                use_mmap (bool): `True` to read the file through `mmap`.
+                batch_size (int): Number of rows stored at once.
+
+            Returns:
+                tablat.Table: Returns the Table (self)
+        """
+        file_path = Path(file)
+        if not file_path.exists():
+            raise IOError('File not found: {}'.format(file_path.resolve()))
+
+        lines = self._read_lines(file_path, encoding, use_mmap)
+        if header is None:
+            sample = []
+            for line in lines:
+                sample.append(line)
+                if len(sample) >= 50:
+                    break
+
+            try:
+                header = csv.Sniffer().has_header(''.join(sample))
+            except csv.Error:
+                header = False
+
+            lines = chain(sample, lines)
+
+        reader = csv.reader(lines, delimiter=delimiter)
+        first_row = next(reader, [])
+        num_columns = len(first_row)
+        if header:
+            headers = first_row
+        else:
+            headers = [str(i) for i in range(num_columns)]
+            reader = chain([first_row], reader) if first_row else reader
+
+        # Columns to load
+        indexes = list(range(num_columns))
+        if columns is not None:
+            indexes = [headers.index(c) if isinstance(c, str) else c for c in columns]
+
+        column_data = [[] for _ in indexes]
+        column_max = [0] * len(indexes)
+        get_cells = itemgetter(*indexes) if len(indexes) > 1 else (lambda row: tuple(row[i] for i in indexes))
+        while indexes:
+            rows = list(islice(reader, batch_size))
+            if not rows:
+                break
+
+            for i, row in enumerate(rows):
+                if len(row) < num_columns:
+                    rows[i] = row + [''] * (num_columns - len(row))
+
+            for j, cells in enumerate(zip(*map(get_cells, rows))):
+                column_data[j].extend(cells)
+                column_max[j] = max(column_max[j], TextWidth.max_width(cells))
+
+        self._set_columns([headers[i] for i in indexes], column_data, column_max=column_max)
+        return self
+
+    def appender(self, batch_size=1000):
+        """
+        Return a `TabAppender` to add complete rows to the table from a thread. Each
+            producer thread should use its own appender: rows are buffered and added
+            in batches, so rows from different threads are never mixed. Rows split
+            in several `add_data` calls should not be added at the same time.
+
+        Args:
+            batch_size (int): Number of rows buffered before they are added.
+                Default value `1000`
+
+        Returns:
+            tablat.TabAppender: The appender.
+        """
+        return TabAppender(self, batch_size)
 
     def add_data(self, data):
         """
-        Add more data to the table.
+        Add more data to the table. Each call is atomic, but a row split in several
+            calls can be mixed with the data of other threads (see `appender`).
 
         Args:
             data (list): List of data to add to the `Table`
         """
-        current_index = len(self._table_data)
-        self._update_columns_max_lenght(data, current_index)
-        self._table_data.extend(data)
+        with self._lock:
+            store = self._store
+            current_index = len(store)
+            texts = store.extend(data)
+            self._update_columns_max_lenght(texts, current_index)
+            # Same as `_data_changed`, without taking the lock again
+            self._version += 1
+            if self._render_cache:
+                self._render_cache.clear()
+
+        if self.stats is not None:
+            self.stats.count('cells_stringified', len(texts))
 
     @property
     def headers(self):
@@ -374,26 +1405,53 @@ class Table(object):
     @headers.setter
     def headers(self, new_headers):
         init_align = not bool(self._headers)
+        old_headers = self._headers
         self._headers = new_headers
+        self._data_changed()
+        if len(new_headers) == self._num_columns:
+            # Same layout, only the renamed columns need new widths
+            self._invalidate_widths([i for i, head in enumerate(new_headers) if head != old_headers[i]])
+            return
+
         self._num_columns = len(new_headers)
+        if self._pending_data is None:
+            self._store.reshape(self._num_columns)
 
-        self._calc_columns_max_lenght()
+        self._clear_row_indexes(False)
+        self._invalidate_widths()
         if init_align:
             self._alignment_init()
         else:
             self._adjust_alignment()
 
+    @property
+    def num_rows(self):
+        """
+        Number of complete rows in the table.
+        """
+        return self._store.num_rows
+
     @property
     def table_data(self):
         """
-        Change the data list to in the `Table`.
+        Change the data list to in the `Table`. The new list is kept as is until
+            the table needs it, and it should not be modified after it is set.
+            The getter returns a flat copy of the data, changes on it are not
+            applied to the table.
         """
-        return self._table_data
+        if self._pending_data is not None:
+            return list(self._pending_data)
+
+        return self._store.flat()
 
     @table_data.setter
     def table_data(self, tab_data):
-        self._table_data
-        self._calc_columns_max_lenght()
+        with self._lock:
+            # The old store is kept until the new one is built by `_store`
+            self._pending_data = tab_data or []
+            self._clear_row_indexes()
+            self._invalidate_widths()
+            self._data_changed()
 
     @property
     def alignment(self):
@@ -410,10 +1468,44 @@ class Table(object):
         try:
             self._align_list = list(new_align)
             self._adjust_alignment()
+            self._data_changed()
 
         except TypeError:
             print('Align value should be a list (or at least an iterable object)')
 
+    def set_column_width(self, column, width, fixed=True, overflow='ellipsis'):
+        """
+        Declare the width of a column. Cells and headers longer than the width are
+            cut when the table is printed. Columns with a fixed width are never
+            scanned, so a table with fixed widths in all the columns starts
+            printing without reading its data first.
+
+        Args:
+            column (int or str): Index or header of the column.
+            width (int): Width of the column. `None` removes the declared width.
+            fixed (bool): `True` to always use `width`, `False` to use it as the max
+                width of the column (the column is narrower if the data is shorter).
+            overflow (str): How long texts are cut. Valid values are:
+                - `ellipsis`: The last visible character is replaced with `…`.
+                - `truncate`: The text is cut at the column width.
+        """
+        col_index = self._get_column_index(column)
+        valid_values = ['ellipsis', 'truncate']
+        if overflow not in valid_values:
+            raise ValueError('Invalid overflow value. Valid values are {}.'.format(valid_values))
+
+        if width is None:
+            self._width_limits.pop(col_index, None)
+
+        elif not isinstance(width, int) or width < 1:
+            raise ValueError('Invalid width: {}. Width must be a positive integer'.format(width))
+
+        else:
+            self._width_limits[col_index] = (width, bool(fixed), overflow)
+
+        self._invalidate_widths([col_index])
+        self._data_changed()
+
     def set_column_align(self, num_column, column_align):
         """
         Set alignment mode for a specific column. Colummn numbering starts form 0.
@@ -429,6 +1521,7 @@ class Table(object):
 
         try:
             self._align_list[num_column] = column_align
+            self._data_changed()
 
         except IndexError:
             raise IndexError('Invalid column index. Current number of columns: {}, index input: {}'.format(self._num_columns, num_column))
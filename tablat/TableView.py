@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+import sys
+from numbers import Real
+
+
+class TableView(object):
+    """
+    Lightweight view over a `Table` that displays a subset of its columns and,
+        optionally, a selection or permutation of its rows.
+
+    The view keeps no copy of the data, headers or widths: it reads them from the
+        table each time it is rendered, so it reflects later changes in the table.
+        Rows are referenced by position in `row_index`; a view without `row_index`
+        shows all the rows, including the ones added later. Usually created with
+        `Table.view()`, `Table.sort_by()` or `Table.where()`.
+
+    Attributes:
+        table (tablat.Table): Table with the data of the view.
+        show_columns (list): Indexes of the columns to show. This list
+            have priority over `hide_columns`.
+        hide_columns (list): Indexes of the columns to hide.
+            If `show_columns` list is provided this list is ignored.
+        row_index (list): Positions of the table rows displayed in the view, in
+            display order. By default all rows are displayed.
+    """
+
+    def __init__(self, table, show_columns=None, hide_columns=None, row_index=None):
+        self._table = table
+        self._show_columns = list(show_columns) if show_columns else None
+        self._hide_columns = list(hide_columns) if hide_columns else None
+        self._row_index = row_index
+
+    def __getitem__(self, i):
+        if self._row_index is not None:
+            i = self._row_index[i]
+
+        row = self._table[i]
+        return [row[c] for c in self._get_column_indexes() if c < len(row)]
+
+    def __str__(self):
+        return self.render()
+
+    def _get_column_indexes(self):
+        """
+        Return the indexes of the table columns displayed in the view
+        """
+        return self._table._get_column_indexes(self._show_columns, self._hide_columns)
+
+    def _get_positions(self):
+        """
+        Return the positions of the table rows displayed in the view
+        """
+        if self._row_index is None:
+            return range(self._table.num_rows)
+
+        return self._row_index
+
+    def _derive(self, row_index):
+        """
+        Return a new view with the same columns and a new row index
+        """
+        return TableView(self._table, self._show_columns, self._hide_columns, row_index)
+
+    @property
+    def headers(self):
+        """
+        Headers of the columns in the view
+        """
+        return [self._table.headers[i] for i in self._get_column_indexes()]
+
+    @property
+    def num_rows(self):
+        """
+        Number of rows in the view
+        """
+        return len(self._get_positions())
+
+    def sort_by(self, column, reverse=False):
+        """
+        Return a view with the rows sorted by the values of a column. If the values
+            can't be compared (mixed types) numbers are sorted first, then texts and
+            then other values by their text, each group in its own order. Empty
+            cells (`''` or `None`) are sorted last in both directions.
+
+        Args:
+            column (int or str): Index or header of the column.
+            reverse (bool): `True` to sort in descending order.
+
+        Returns:
+            tablat.TableView: The sorted view.
+        """
+        col_index = self._table._get_column_index(column)
+        store = self._table._store
+        positions = self._get_positions()
+        try:
+            row_index = sorted(positions, key=store.column(col_index).__getitem__, reverse=reverse)
+
+        except TypeError:
+            column = store.column(col_index)
+            empty = [i for i in positions if column[i] is None or column[i] == '']
+            if empty:
+                empty_set = set(empty)
+                positions = [i for i in positions if i not in empty_set]
+
+            row_index = sorted(positions, key=lambda i: self._mixed_key(column[i]), reverse=reverse) + empty
+
+        return self._derive(row_index)
+
+    @staticmethod
+    def _mixed_key(value):
+        """
+        Return a sort key for values of different types: numbers, texts and then
+            other values by their text
+        """
+        if isinstance(value, Real):
+            return 0, value, ''
+
+        if isinstance(value, str):
+            return 1, 0, value
+
+        return 2, 0, str(value)
+
+    def where(self, column_or_predicate, value=None):
+        """
+        Return a view with the rows that match a condition: a column equal to a value,
+            or a function that receives the row (a list with all the cells) and
+            returns `True` for the rows to keep. Equality filters use the hash index
+            of the column if it was created with `Table.create_index`.
+
+        Args:
+            column_or_predicate (int, str or callable): Index or header of the column
+                to compare, or a function to filter the rows.
+            value: Value to find in the column.
+
+        Returns:
+            tablat.TableView: The filtered view.
+        """
+        table = self._table
+        if callable(column_or_predicate):
+            return self._derive([i for i in self._get_positions() if column_or_predicate(table[i])])
+
+        matches = table._find_rows(table._get_column_index(column_or_predicate), value)
+        if self._row_index is None:
+            return self._derive(matches)
+
+        selected = set(matches)
+        return self._derive([i for i in self._row_index if i in selected])
+
+    def iter_lines(self, rows=None):
+        """
+        Generates the lines of the view lazily, one `str` per line without
+            the line break.
+
+        Args:
+            rows (slice): Rows to print. By default all rows are printed.
+
+        Returns:
+            iterator: The lines of the table.
+        """
+        return self._table._iter_lines(self._get_column_indexes(), rows, self._row_index)
+
+    def render_to(self, fp, rows=None):
+        """
+        Writes the view to a text stream in buffered chunks.
+
+        Args:
+            fp: Any object with a `write(str)` method.
+            rows (slice): Rows to print. By default all rows are printed.
+        """
+        self._table._measure('render', self._table._write_table, fp, self._get_column_indexes(), rows, self._row_index)
+
+    def arender(self, rows=None):
+        """
+        Generates the view asynchronously in `str` chunks (see `Table.arender`).
+
+        Args:
+            rows (slice): Rows to print. By default all rows are printed.
+
+        Returns:
+            async iterator: The chunks of the view, each line ended with a line break.
+        """
+        return self._table._arender(self._get_column_indexes(), rows, self._row_index)
+
+    async def render_to_async(self, writer, rows=None, encoding=None):
+        """
+        Writes the view to an asynchronous writer in chunks (see `Table.render_to_async`).
+
+        Args:
+            writer: Object with a `write` method, a regular method or a coroutine.
+            rows (slice): Rows to print. By default all rows are printed.
+            encoding (str): Encoding of the chunks for writers of `bytes`. By default
+                `utf-8` for an `asyncio.StreamWriter`, otherwise `str` chunks are written.
+        """
+        await self._table._write_async(writer, self.arender(rows), encoding)
+
+    def render(self, rows=None):
+        """
+        Returns the view as a `str`.
+
+        Args:
+            rows (slice): Rows to print. By default all rows are printed.
+
+        Returns:
+            str: The rendered table, each line ended with a line break.
+        """
+        return self._table._measure('render', self._table._render_text, self._get_column_indexes(), rows,
+                                    self._row_index)
+
+    def export(self, fp, output_format='csv', rows=None):
+        """
+        Writes the view to a text stream in another format (see `Table.export`).
+
+        Args:
+            fp: Any object with a `write(str)` method.
+            output_format (str or tablat.TabWriter): Name of the output format or a writer.
+            rows (slice): Rows to write. By default all rows are written.
+        """
+        self._table._measure('export', self._table._export, fp, output_format, self._get_column_indexes(), rows,
+                             self._row_index)
+
+    def print_table(self, rows=None):
+        """
+        Prints the view.
+
+        Args:
+            rows (slice): Rows to print. By default all rows are printed.
+        """
+        self.render_to(sys.stdout, rows)
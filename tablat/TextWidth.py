@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+import re
+import unicodedata
+from itertools import islice
+
+# CSI sequences (colours, cursor), OSC sequences (hyperlinks) and two characters escapes
+ANSI_ESCAPE = re.compile(r'\x1b\[[0-?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)|\x1b[@-Z\\-_]')
+ANSI_SPLIT = re.compile('({})'.format(ANSI_ESCAPE.pattern))
+ANSI_RESET = '\x1b[0m'
+
+
+class _WidthTable(dict):
+    """
+    Display width of each character, calculated the first time it is looked up
+    """
+
+    def __missing__(self, char):
+        width = 1
+        if unicodedata.combining(char) or unicodedata.category(char) in ('Mn', 'Me', 'Cf'):
+            width = 0
+
+        elif unicodedata.east_asian_width(char) in ('W', 'F'):
+            width = 2
+
+        self[char] = width
+        return width
+
+
+class TextWidth(object):
+    """
+    Display width of texts in a terminal, used to calculate the column widths and
+        to align the cells.
+
+    Texts with only ASCII characters and without escape codes have a width equal to
+        their lenght, which is checked for whole chunks of texts at once. For other
+        texts the ANSI escape codes are ignored, East Asian wide and full width
+        characters (CJK, emoji) count as two and combining characters as zero.
+        The width of each character is cached in a lookup table.
+    """
+
+    chunk_size = 4096
+    _widths = _WidthTable()
+
+    @staticmethod
+    def is_plain(text):
+        """
+        Return `True` if the display width of the text is its lenght: only ASCII
+            characters and no escape codes.
+
+        Args:
+            text (str): The text to check.
+
+        Returns:
+            bool: If the text is plain.
+        """
+        return text.isascii() and '\x1b' not in text
+
+    @classmethod
+    def width(cls, text):
+        """
+        Return the display width of a text.
+
+        Args:
+            text (str): The text to measure.
+
+        Returns:
+            int: Number of terminal cells used by the text.
+        """
+        if text.isascii() and '\x1b' not in text:
+            return len(text)
+
+        if '\x1b' in text:
+            text = ANSI_ESCAPE.sub('', text)
+            if text.isascii():
+                return len(text)
+
+        return sum(map(cls._widths.__getitem__, text))
+
+    @classmethod
+    def max_width(cls, texts):
+        """
+        Return the display width of the widest text.
+
+        Args:
+            texts (iterable): The texts to measure.
+
+        Returns:
+            int: The max width, `0` if there are no texts.
+        """
+        result = 0
+        for chunk in cls._chunks(texts):
+            joined = ''.join(chunk)
+            if joined.isascii() and '\x1b' not in joined:
+                width = max(map(len, chunk), default=0)
+
+            else:
+                width = max(map(cls.width, chunk), default=0)
+
+            if width > result:
+                result = width
+
+        return result
+
+    @classmethod
+    def _chunks(cls, texts):
+        """
+        Generates lists of up to `chunk_size` texts
+        """
+        chunk_size = cls.chunk_size
+        if isinstance(texts, list):
+            if len(texts) <= chunk_size:
+                yield texts
+            else:
+                for start in range(0, len(texts), chunk_size):
+                    yield texts[start:start + chunk_size]
+
+            return
+
+        iterator = iter(texts)
+        chunk = list(islice(iterator, chunk_size))
+        while chunk:
+            yield chunk
+            chunk = list(islice(iterator, chunk_size))
+
+    @classmethod
+    def pad(cls, text, width, align):
+        """
+        Return the text padded with spaces to a display width, like `format` does
+            with the lenght.
+
+        Args:
+            text (str): The text to pad.
+            width (int): The display width.
+            align (str): Alignment character: `<`, `>` or `^`.
+
+        Returns:
+            str: The padded text.
+        """
+        space = width - cls.width(text)
+        if space <= 0:
+            return text
+
+        if align == '<':
+            return text + ' ' * space
+
+        if align == '^':
+            return ' ' * (space // 2) + text + ' ' * (space - space // 2)
+
+        return ' ' * space + text
+
+    @classmethod
+    def clip(cls, text, width, ellipsis=''):
+        """
+        Return the text cut to a display width. Escape codes are kept and a reset
+            code is added if the text is cut after one of them.
+
+        Args:
+            text (str): The text to cut.
+            width (int): Max display width of the result.
+            ellipsis (str): Text added at the end when the text is cut, included in
+                the width. Default value `''`
+
+        Returns:
+            str: The text if it fits, otherwise the cut text.
+        """
+        if cls.width(text) <= width:
+            return text
+
+        width = max(width - len(ellipsis), 0)
+        if text.isascii() and '\x1b' not in text:
+            return text[:width] + ellipsis
+
+        widths = cls._widths
+        parts = []
+        used = 0
+        escaped = False
+        for i, part in enumerate(ANSI_SPLIT.split(text)):
+            if i % 2:
+                parts.append(part)
+                escaped = True
+                continue
+
+            for char in part:
+                used += widths[char]
+                if used > width:
+                    break
+
+                parts.append(char)
+
+            if used > width:
+                break
+
+        parts.append(ellipsis)
+        if escaped:
+            parts.append(ANSI_RESET)
+
+        return ''.join(parts)
@@ -1,2 +1,12 @@
 from tablat.Table import Table
 from tablat.TabStyle import TabStyle
+from tablat.StreamTable import StreamTable
+from tablat.ColumnStore import ColumnStore
+from tablat.TableView import TableView
+from tablat.ArrayStore import ArrayStore
+from tablat.TabWriter import TabWriter
+from tablat.TabStats import TabStats
+from tablat.CompactStore import CompactStore
+from tablat.CompactTable import CompactTable
+from tablat.TabAppender import TabAppender
+from tablat.TextWidth import TextWidth
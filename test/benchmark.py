@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the main `Table` operations with synthetic datasets.
+
+Usage:
+    python test/benchmark.py --quick
+    python test/benchmark.py --save baseline.json
+    python test/benchmark.py --compare baseline.json
+
+Each case reports the rows processed per second, the peak memory allocated while
+    running it (measured with `tracemalloc` in a second run) and, for rendering
+    cases, the time until the first chunk is written.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/..")
+from tablat import Table, TabStyle
+import argparse
+import itertools
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROW_SIZES = [1000, 10000, 100000, 1000000]
+COLUMN_SIZES = [1, 10, 100]
+QUICK_ROW_SIZES = [1000, 10000]
+QUICK_COLUMN_SIZES = [1, 10]
+MASKS = {
+    'all': {},
+    'show_half': {'show_columns': 'half'},
+    'hide_first': {'hide_columns': [0]},
+}
+
+
+class Sink(object):
+    """
+    Text stream that discards the output, keeping the time of the first write
+    """
+
+    def __init__(self):
+        self.first_write = None
+        self.size = 0
+
+    def write(self, text):
+        if self.first_write is None:
+            self.first_write = time.perf_counter()
+
+        self.size += len(text)
+
+
+def create_dataset(num_rows, num_columns, seed=0):
+    """
+    Returns the headers and a flat data list with integers, floats and words
+    """
+    rand = random.Random(seed)
+    words = ['madrid', 'lisboa', 'paris', 'new york', 'san francisco', 'a', 'tokyo', 'buenos aires']
+    generators = [
+        lambda: rand.randint(0, 1000000),
+        lambda: round(rand.uniform(-1000, 1000), 3),
+        lambda: rand.choice(words),
+    ]
+    column_generators = [generators[i % len(generators)] for i in range(num_columns)]
+    headers = ['COLUMN_{}'.format(i) for i in range(num_columns)]
+    data = [gen() for _ in range(num_rows) for gen in column_generators]
+    return headers, data
+
+
+def measure(function, num_rows, memory=True):
+    """
+    Runs a case and returns its metrics. `function` returns a `Sink` for rendering cases
+    """
+    start = time.perf_counter()
+    sink = function()
+    elapsed = time.perf_counter() - start
+
+    result = {
+        'seconds': elapsed,
+        'rows_per_sec': num_rows / elapsed if elapsed else float('inf'),
+    }
+    if isinstance(sink, Sink) and sink.first_write is not None:
+        result['first_byte'] = sink.first_write - start
+
+    if memory:
+        tracemalloc.start()
+        function()
+        result['peak_mb'] = tracemalloc.get_traced_memory()[1] / (1 << 20)
+        tracemalloc.stop()
+
+    return result
+
+
+def build_cases(headers, data, num_rows, tmp_dir):
+    """
+    Returns a `dict` with the name and the function of each case for a dataset
+    """
+    num_columns = len(headers)
+    columns = {h: data[i::num_columns] for i, h in enumerate(headers)}
+    json_path = Path(tmp_dir) / 'data_{}x{}.json'.format(num_rows, num_columns)
+    with open(json_path, 'w') as f:
+        json.dump(columns, f)
+
+    batch = 1000 * num_columns
+
+    def construction():
+        table = Table(data, headers)
+        return table._column_max
+
+    def add_data():
+        table = Table(headers=headers)
+        for start in range(0, len(data), batch):
+            table.add_data(data[start:start + batch])
+
+        return table._column_max
+
+    def set_column_content():
+        return Table().set_column_content(columns)._column_max
+
+    def load_data():
+        table = Table()
+        table.load_data(json_path)
+        return table._column_max
+
+    cases = {
+        'construction': construction,
+        'add_data': add_data,
+        'set_column_content': set_column_content,
+        'load_data': load_data,
+    }
+
+    table = Table(data, headers)
+    table._column_max
+    for (borders, row_sep, col_sep), (mask_name, mask) in itertools.product(
+            itertools.product([True, False], repeat=3), MASKS.items()):
+        style = TabStyle(borders, row_sep, col_sep)
+        mask = dict(mask)
+        if mask.get('show_columns') == 'half':
+            mask['show_columns'] = list(range(0, num_columns, 2))
+
+        def print_table(style=style, mask=mask):
+            table.style = style
+            sink = Sink()
+            table.render_to(sink, **mask)
+            return sink
+
+        name = 'print_table[b={:d},r={:d},c={:d},{}]'.format(borders, row_sep, col_sep, mask_name)
+        cases[name] = print_table
+
+    return cases
+
+
+def run(row_sizes, column_sizes, max_cells, memory=True):
+    """
+    Runs all the cases for each dataset size and returns the results by case key
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for num_rows, num_columns in itertools.product(row_sizes, column_sizes):
+            if num_rows * num_columns > max_cells:
+                continue
+
+            headers, data = create_dataset(num_rows, num_columns)
+            for name, function in build_cases(headers, data, num_rows, tmp_dir).items():
+                key = '{}/{}x{}'.format(name, num_rows, num_columns)
+                results[key] = measure(function, num_rows, memory)
+                print('{:<60} {:>14,.0f} rows/s'.format(key, results[key]['rows_per_sec']), file=sys.stderr)
+
+    return results
+
+
+def report(results, baseline=None, tolerance=0.1):
+    """
+    Prints the results, compared with the baseline results if provided. Returns
+        the keys of the cases slower than the baseline.
+    """
+    headers = ['CASE', 'ROWS/S', 'PEAK_MB', 'FIRST_BYTE_MS']
+    if baseline is not None:
+        headers.append('VS_BASELINE')
+
+    table = Table(headers=headers)
+    table.set_column_align(0, '<')
+    slower = []
+    for key, result in results.items():
+        row = [key, '{:,.0f}'.format(result['rows_per_sec']),
+               '{:.1f}'.format(result['peak_mb']) if 'peak_mb' in result else '-',
+               '{:.2f}'.format(result['first_byte'] * 1000) if 'first_byte' in result else '-']
+
+        if baseline is not None:
+            base = baseline.get(key)
+            if base is None:
+                row.append('new')
+
+            else:
+                ratio = result['rows_per_sec'] / base['rows_per_sec']
+                row.append('{:+.1%}'.format(ratio - 1))
+                if ratio < 1 - tolerance:
+                    slower.append(key)
+
+        table.add_data(row)
+
+    table.print_table()
+    return slower
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='tablat benchmark')
+    parser.add_argument('--quick', action='store_true', help='Run only the small datasets')
+    parser.add_argument('--rows', type=int, nargs='+', help='Number of rows of the datasets')
+    parser.add_argument('--columns', type=int, nargs='+', help='Number of columns of the datasets')
+    parser.add_argument('--max-cells', type=int, default=10000000,
+                        help='Datasets with more cells are skipped (default 10M)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the peak memory measurement')
+    parser.add_argument('--save', type=Path, help='Write the results to a json file')
+    parser.add_argument('--compare', type=Path, help='Compare the results with a saved json file')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='Slowdown allowed when comparing before failing (default 0.1)')
+    args = parser.parse_args()
+
+    row_sizes = args.rows or (QUICK_ROW_SIZES if args.quick else ROW_SIZES)
+    column_sizes = args.columns or (QUICK_COLUMN_SIZES if args.quick else COLUMN_SIZES)
+    results = run(row_sizes, column_sizes, args.max_cells, not args.no_memory)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+
+    slower = report(results, baseline, args.tolerance)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if slower:
+        print('\n{} cases slower than the baseline:\n  {}'.format(len(slower), '\n  '.join(slower)))
+        sys.exit(1)
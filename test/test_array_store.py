@@ -0,0 +1,74 @@
+from tablat import Table
+import sys
+import subprocess
+import unittest
+from pathlib import Path
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestArrayStore(unittest.TestCase):
+
+    _headers = ['id', 'value', 'ratio']
+
+    def get_array(self, num_rows=25):
+        """
+        Returns a 2 dimensions test array
+        """
+        ids = numpy.arange(num_rows)
+        return numpy.column_stack([ids, ids * 1000, ids / 4])
+
+    def test_from_numpy(self):
+        """
+        Test a table from an array renders like a table from a list
+        """
+        array = self.get_array()
+        table = Table.from_numpy(array, self._headers)
+        list_table = Table(array.ravel().tolist(), self._headers)
+
+        self.assertEqual(table._column_max, list_table._column_max)
+        self.assertEqual(table.render(), list_table.render())
+        self.assertEqual(table.render(rows=slice(3, 20, 2)), list_table.render(rows=slice(3, 20, 2)))
+
+    def test_array_add_data(self):
+        """
+        Test data can be added to a table created from an array
+        """
+        table = Table.from_numpy(self.get_array(2), self._headers)
+        table.add_data([2.0, 123456789.0, 0.5])
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(table[2], [2.0, 123456789.0, 0.5])
+        self.assertEqual(table._column_max[1], 11)
+
+    def test_lazy_import(self):
+        """
+        Test `numpy` is only imported when a table uses arrays
+        """
+        code = 'import sys, tablat; print("numpy" in sys.modules)'
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=Path(__file__).parent.parent, text=True)
+        self.assertEqual(output.strip(), 'False')
+
+    @unittest.skipIf(pandas is None, 'pandas is not installed')
+    def test_from_dataframe(self):
+        """
+        Test a table from a data frame keeps the column names and content
+        """
+        column_data = {'name': ['a', 'bb', 'ccc'], 'num': [1, 22, 4444], 'ratio': [0.5, 1.25, 10.0]}
+        table = Table.from_dataframe(pandas.DataFrame(column_data))
+
+        self.assertEqual(table.headers, ['name', 'num', 'ratio'])
+        self.assertEqual(table._column_max, [4, 4, 5])
+        self.assertEqual(table.render(), Table().set_column_content(column_data).render())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+from tablat import ColumnStore
+import unittest
+
+
+class TestColumnStore(unittest.TestCase):
+
+    def test_extend(self):
+        """
+        Test cells are distributed by columns following the row order
+        """
+        store = ColumnStore(3, [1, 2, 3, 4])
+        store.extend([5, 6, 7])
+        self.assertEqual(store.column(0), [1, 4, 7])
+        self.assertEqual(store.column(1), [2, 5])
+        self.assertEqual(store.num_rows, 2)
+        self.assertEqual(len(store), 7)
+        self.assertEqual(store.flat(), [1, 2, 3, 4, 5, 6, 7])
+
+        # Single rows, aligned with the columns or not
+        self.assertEqual(store.extend([8, 9, 10]), ['8', '9', '10'])
+        self.assertEqual(store.column(1), [2, 5, 8])
+        store = ColumnStore(2)
+        for row in [[1, 'a'], [2, 'b']]:
+            store.extend(row)
+
+        self.assertEqual(store.text_column(1), ['a', 'b'])
+        self.assertEqual(store.num_rows, 2)
+
+    def test_rows(self):
+        """
+        Test row access and iteration over complete rows
+        """
+        store = ColumnStore(2, ['a', 1, 'b', 2, 'c'])
+        self.assertEqual(store.row(1), ['b', 2])
+        self.assertEqual(store.row(2), ['c'])
+        self.assertEqual(store.row(-1), ['c'])
+        self.assertEqual(store.row(5), [])
+        self.assertEqual(list(store.rows()), [('a', 1), ('b', 2)])
+        self.assertEqual(list(store.rows([1], start=1)), [(2,)])
+
+    def test_reshape(self):
+        """
+        Test reshape keeps the row order, also from a store without columns
+        """
+        store = ColumnStore(0, [1, 2, 3, 4, 5, 6])
+        self.assertEqual(store.num_rows, 0)
+        store.reshape(3)
+        self.assertEqual(store.column(2), [3, 6])
+        store.reshape(2)
+        self.assertEqual(store.column(1), [2, 4, 6])
+
+
+if __name__ == '__main__':
+    unittest.main()
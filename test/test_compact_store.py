@@ -0,0 +1,64 @@
+from tablat import Table, CompactTable, CompactStore, TabStyle
+from array import array
+import unittest
+
+
+class TestCompactStore(unittest.TestCase):
+
+    def get_data(self, num_rows=3000):
+        """
+        Returns a flat data list with int, float, repeated str and unique str columns
+        """
+        data = []
+        for i in range(num_rows):
+            data.extend([i, i * 0.25, ['Y', 'N', 'unknown'][i % 3], 'row_{}'.format(i)])
+
+        return data
+
+    def test_compact_columns(self):
+        """
+        Test the columns are stored in compact form and keep their values
+        """
+        data = self.get_data()
+        store = CompactStore(4, data)
+        self.assertIsInstance(store.column(0), array)
+        self.assertIsInstance(store.column(1), array)
+        self.assertEqual(store._columns[2].values, ['Y', 'N', 'unknown'])
+        self.assertIsInstance(store.column(3), list)
+
+        self.assertEqual(store.flat(), data)
+        self.assertEqual(store.row(4), [4, 1.0, 'N', 'row_4'])
+        self.assertEqual(list(store.rows(start=2999, text=True)), [('2999', '749.75', 'unknown', 'row_2999')])
+        self.assertEqual(store.text_width(1), 6)
+        self.assertEqual(store.find(2, 'unknown')[:2], [2, 5])
+
+    def test_expand_columns(self):
+        """
+        Test values that don't fit in a compact column turn it into a list
+        """
+        store = CompactStore.from_columns([list(range(2000)), ['a', 'b'] * 1000])
+        store.extend([True, 'c', 2 ** 70, 'a'])
+        self.assertIsInstance(store.column(0), list)
+        self.assertEqual(store.column(1).values, ['a', 'b', 'c'])
+        self.assertEqual(store.row(-1), [2 ** 70, 'a'])
+        self.assertEqual(store.text_column(0)[2000], 'True')
+
+    def test_table_output(self):
+        """
+        Test a `CompactTable` renders exactly like a `Table`
+        """
+        headers = ['ID', 'VALUE', 'FLAG', 'NAME']
+        data = self.get_data()
+        table = Table(data, headers, style=TabStyle(col_sep=True))
+        compact_table = CompactTable(data, headers, style=TabStyle(col_sep=True))
+        self.assertEqual(compact_table.render(), table.render())
+        self.assertEqual(compact_table.sort_by('FLAG').render(rows=slice(10)),
+                         table.sort_by('FLAG').render(rows=slice(10)))
+        self.assertEqual(compact_table.get_column_content(), table.get_column_content())
+
+        compact_table.add_data([-1, 'x', None, 'row'])
+        table.add_data([-1, 'x', None, 'row'])
+        self.assertEqual(compact_table.render(), table.render())
+
+        with self.assertRaises(AttributeError):
+            compact_table.other_attribute = 1
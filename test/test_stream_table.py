@@ -0,0 +1,81 @@
+from tablat import Table, StreamTable
+import unittest
+
+
+class TestStreamTable(unittest.TestCase):
+
+    _headers = ['id', 'name', 'value']
+
+    def get_rows(self, num_rows=50):
+        """
+        Returns a generator with test rows
+        """
+        return ([i, 'row_{}'.format('x' * (i % 9)), i * 1.5] for i in range(num_rows))
+
+    def test_sample_widths(self):
+        """
+        Test column widths calculated from the sampled rows
+        """
+        table = StreamTable(self.get_rows(), self._headers, sample_size=3)
+        table.render()
+        self.assertEqual(table._column_max, [2, 6, 5])
+
+    def test_declared_widths(self):
+        """
+        Test declared widths are used (never shorter than the header)
+        """
+        table = StreamTable(self.get_rows(), self._headers, widths=[1, 20])
+        table.render()
+        self.assertEqual(table._column_max, [2, 20, 5])
+
+    def test_two_pass(self):
+        """
+        Test two pass mode output matches an in memory `Table`
+        """
+        rows = list(self.get_rows())
+        table = Table([d for row in rows for d in row], self._headers)
+        stream_table = StreamTable(rows, self._headers, two_pass=True)
+        self.assertEqual(stream_table.render(), table.render())
+
+        with self.assertRaises(ValueError):
+            StreamTable(self.get_rows(), self._headers, two_pass=True)
+
+    def test_row_fitting(self):
+        """
+        Test short rows are filled and long rows are truncated
+        """
+        table = StreamTable([[1], [2, 3, 4, 5]], ['a', 'b'], two_pass=True)
+        lines = table.render().split('\n')
+        self.assertEqual(lines[3], '|   1       |')
+        self.assertEqual(lines[4], '|   2   3   |')
+
+    def test_head_tail_page(self):
+        """
+        Test partial renders read only the needed rows of the source
+        """
+        rows = list(self.get_rows(6))
+        table = Table([d for row in rows for d in row], self._headers)
+
+        tail_lines = StreamTable(self.get_rows(6), self._headers).tail(2).split('\n')
+        self.assertEqual(len(tail_lines), 8)
+        self.assertEqual(tail_lines[3:5], table.tail(2).split('\n')[3:5])
+        self.assertEqual(tail_lines[-2], '... 4 more rows')
+
+        head_lines = StreamTable(self.get_rows(6), self._headers).head(2).split('\n')
+        self.assertEqual(len(head_lines), 8)
+        self.assertEqual(head_lines[3].split(), ['|', '0', 'row_', '0.0', '|'])
+        self.assertEqual(head_lines[-2], '... more rows')
+
+        page = StreamTable(self.get_rows(6), self._headers).page(2, 2)
+        self.assertEqual(page.split('\n')[3].split(), ['|', '4', 'row_xxxx', '6.0', '|'])
+        self.assertNotIn('more rows', page)
+
+        with self.assertRaises(ValueError):
+            StreamTable(self.get_rows(6), self._headers).page(-1, 1)
+
+        with self.assertRaises(ValueError):
+            table.page(-1, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import csv
+import json
+from tablat import Table, StreamTable, TabWriter
+import unittest
+from io import StringIO
+
+
+class TestTabWriter(unittest.TestCase):
+
+    _headers = ['name', 'value', 'note']
+    _data = ['a|b', 1, '<x>', 'c', 2.5, 'q,"z', 'd', None, '']
+
+    def export(self, table, output_format, **kwargs):
+        """
+        Returns the table exported to a `str`
+        """
+        output = StringIO()
+        table.export(output, output_format, **kwargs)
+        return output.getvalue()
+
+    def test_csv(self):
+        """
+        Test `csv` and `tsv` output can be read back
+        """
+        table = Table(self._data, self._headers)
+        rows = list(csv.reader(StringIO(self.export(table, 'csv'))))
+        self.assertEqual(rows[0], self._headers)
+        self.assertEqual(rows[2], ['c', '2.5', 'q,"z'])
+
+        rows = list(csv.reader(StringIO(self.export(table, 'tsv', hide_columns=[0])), delimiter='\t'))
+        self.assertEqual(rows[1], ['1', '<x>'])
+
+    def test_markdown(self):
+        """
+        Test Markdown output with alignment and escaped separators
+        """
+        table = Table(self._data, self._headers)
+        table.set_column_align(2, '^')
+        lines = self.export(table, 'markdown', rows=slice(0, 1)).split('\n')
+        self.assertEqual(lines[0], '| name | value | note |')
+        self.assertEqual(lines[1], '| :--- | ---: | :---: |')
+        self.assertEqual(lines[2], '| a\\|b | 1 | <x> |')
+        self.assertEqual(len(lines), 4)
+
+    def test_html(self):
+        """
+        Test HTML output escapes the cells
+        """
+        table = Table(self._data, self._headers)
+        html_str = self.export(table, 'html', show_columns=[0, 2])
+        self.assertIn('<th>name</th><th>note</th>', html_str)
+        self.assertIn('<td style="text-align: right">&lt;x&gt;</td>', html_str)
+        self.assertNotIn('<th>value</th>', html_str)
+
+    def test_json(self):
+        """
+        Test `json` and `json lines` output keep the cell values
+        """
+        table = Table(self._data, self._headers)
+        objects = json.loads(self.export(table, 'json'))
+        self.assertEqual(objects[1], {'name': 'c', 'value': 2.5, 'note': 'q,"z'})
+        self.assertIsNone(objects[2]['value'])
+
+        lines = self.export(table.view(show_columns=[1]), 'jsonl').splitlines()
+        self.assertEqual([json.loads(line) for line in lines], [{'value': 1}, {'value': 2.5}, {'value': None}])
+        self.assertEqual(json.loads(self.export(Table([], ['a']), 'json')), [])
+
+    def test_stream_export(self):
+        """
+        Test exporting a `StreamTable` doesn't need column widths
+        """
+        table = StreamTable(iter([[1, 'x'], [2, 'y']]), ['num', 'letter'], sample_size=0)
+        self.assertEqual(json.loads(self.export(table, 'json')), [{'num': 1, 'letter': 'x'}, {'num': 2, 'letter': 'y'}])
+        self.assertEqual(table._column_max, [3, 6])
+
+    def test_custom_writer(self):
+        """
+        Test registering a new output format
+        """
+        class NamesWriter(TabWriter):
+            def iter_lines(self, headers, align_list, column_max, rows):
+                yield ' '.join(headers)
+
+        TabWriter.register('names', NamesWriter)
+        self.assertEqual(self.export(Table(headers=['a', 'b']), 'names'), 'a b\n')
+        with self.assertRaises(ValueError):
+            self.export(Table(headers=['a']), 'unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
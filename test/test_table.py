@@ -1,9 +1,19 @@
 import sys
+import csv
+import subprocess
 import json
-from tablat import Table
+import sqlite3
+import asyncio
+import threading
+import pickle
+import copy
+from tablat import Table, StreamTable, TabStyle, ColumnStore, TabStats, CompactTable
 import unittest
+import tempfile
 from pathlib import Path
 from io import StringIO
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 
 class TestTable(unittest.TestCase):
@@ -44,7 +54,7 @@ class TestTable(unittest.TestCase):
         expected_data = self.get_test_expected()['test_data_update']
 
         table = Table(data_obj['data'], data_obj['headers'])
-        table.table_data = list.reverse(table.table_data)
+        table.table_data = list(reversed(table.table_data))
         self.assertEqual(table._num_columns, expected_data['num_columns'])
         self.assertEqual(table._column_max, expected_data['columns_max'])
 
@@ -60,6 +70,14 @@ class TestTable(unittest.TestCase):
         self.assertEqual(table._num_columns, expected_data['num_columns'])
         self.assertEqual(table._column_max, expected_data['columns_max'])
 
+        # Rows added one by one keep the declared widths
+        table = Table(headers=['A', 'B'])
+        table.set_column_width('B', 4, fixed=False)
+        table.add_data(['abc', 'long text'])
+        self.assertEqual(table._column_max, [3, 4])
+        table.add_data(['東京都', 'x'])
+        self.assertEqual(table._column_max, [6, 4])
+
     def test_getitem(self):
         """
         Test `getitem` magic method
@@ -233,6 +251,670 @@ class TestTable(unittest.TestCase):
         tab_column_dict = table.get_column_content()
         self.assertEqual(tab_column_dict, expected_data['column_data'])
 
+    def test_render(self):
+        """
+        Test `render`, `render_to` and `iter_lines` produce the same output as `print_table`
+        """
+        data_obj = self.get_data()
+        table = Table(data_obj['data'], data_obj['headers'])
+        table.style.update(True, True, True)
+
+        # Get printed table
+        stdout_backup = sys.stdout
+        sys.stdout = StringIO()
+        table.print_table(hide_columns=[1])
+        printed_str = sys.stdout.getvalue()
+        sys.stdout.close()
+        sys.stdout = stdout_backup
+
+        # Render to str and stream
+        buffer = StringIO()
+        table.render_to(buffer, hide_columns=[1])
+        self.assertEqual(table.render(hide_columns=[1]), printed_str)
+        self.assertEqual(buffer.getvalue(), printed_str)
+        self.assertEqual(list(table.iter_lines(hide_columns=[1])), printed_str.split('\n')[:-1])
+        self.assertEqual(str(table), table.render())
+
+    def test_cell_text_cache(self):
+        """
+        Test each cell is converted to `str` only once, when it is added
+        """
+        class Cell(object):
+            calls = 0
+
+            def __str__(self):
+                Cell.calls += 1
+                return 'cell'
+
+        table = Table([Cell(), Cell(), True], ['A', 'B'])
+        table.add_data([Cell()])
+        table.render()
+        table.render(show_columns=[1])
+        self.assertEqual(Cell.calls, 3)
+        self.assertEqual(table._column_max, [4, 4])
+        self.assertIn('True', table.render())
+
+    def test_view(self):
+        """
+        Test views render the same as the column filters and follow table changes
+        """
+        data_obj = self.get_data()
+        table = Table(data_obj['data'], data_obj['headers'])
+        view = table.view(show_columns=[2, 0, 9])
+
+        self.assertEqual(view.headers, ['country', 'name'])
+        self.assertEqual(view[0], ['Andorra', 'les Escaldes'])
+        self.assertEqual(view.render(), table.render(show_columns=[0, 2]))
+        self.assertEqual(table.view(hide_columns=[-1]).render(), table.render(hide_columns=[3]))
+
+        table.add_data(['New Heaven', 0, 'Resistance', 'Earth'])
+        self.assertIn('Resistance', str(view))
+
+    def test_layout_cache(self):
+        """
+        Test compiled layouts are reused until widths or style change
+        """
+        data_obj = self.get_data()
+        table = Table(data_obj['data'], data_obj['headers'])
+
+        layout = table._get_layout([0, 1])
+        self.assertIs(table._get_layout([0, 1]), layout)
+        self.assertIsNot(table._get_layout([0, 2]), layout)
+
+        table.add_data(['A much longer country name'])
+        layout_widths = table._get_layout([0, 1])
+        self.assertIsNot(layout_widths, layout)
+
+        table.style.row_sep = True
+        self.assertIsNot(table._get_layout([0, 1]), layout_widths)
+        self.assertEqual(len(table.render().split('\n')), 2 * 14 + 5)
+
+    def test_row_window(self):
+        """
+        Test rendering a slice of rows, pages, head and tail
+        """
+        data_obj = self.get_data()
+        table = Table(data_obj['data'], data_obj['headers'])
+        all_lines = table.render().split('\n')
+
+        # Rows keep the widths of the whole table
+        window_lines = table.render(rows=slice(3, 5)).split('\n')
+        self.assertEqual(window_lines[3:5], all_lines[6:8])
+        self.assertEqual(len(window_lines), 7)
+        self.assertEqual(table.render(rows=slice(-1, None)).split('\n')[3], all_lines[16])
+
+        head_lines = table.head(2).split('\n')
+        self.assertEqual(head_lines[3:5], all_lines[3:5])
+        self.assertEqual(head_lines[-2], '... 12 more rows')
+        self.assertEqual(table.tail(1).split('\n')[3], all_lines[16])
+        self.assertEqual(table.page(6, 2).split('\n')[3:5], all_lines[15:17])
+        self.assertNotIn('more rows', table.page(6, 2))
+
+        with self.assertRaises(ValueError):
+            table.render(rows=slice(None, None, -1))
+
+    def test_render_new(self):
+        """
+        Test append mode writes only new rows and headers again when widths grow
+        """
+        table = Table(['a', 1, 'b', 2], ['name', 'num'])
+        output = StringIO()
+        self.assertEqual(table.render_new(output), 2)
+        self.assertEqual(len(output.getvalue().split('\n')), 6)
+
+        # Same widths, only the new row
+        table.add_data(['c', 3])
+        output = StringIO()
+        self.assertEqual(table.render_new(output), 1)
+        self.assertEqual(output.getvalue(), '|   c        3   |\n')
+        self.assertEqual(table.render_new(output), 0)
+
+        # Width grows, headers written again
+        table.add_data(['a longer name', 4])
+        output = StringIO()
+        self.assertEqual(table.render_new(output), 1)
+        lines = output.getvalue().split('\n')
+        self.assertEqual(lines[0], '')
+        self.assertIn('name', lines[2])
+        self.assertIn('a longer name', lines[4])
+
+        # Terminal output is redrawn in place
+        output = StringIO()
+        output.isatty = lambda: True
+        table.add_data(['the longest name', 5])
+        self.assertEqual(table.render_new(output), 5)
+        self.assertTrue(output.getvalue().startswith('\x1b[11F\x1b[J'))
+
+        # Replaced data is written again from the first row
+        table.table_data = ['a', 1, 'b', 2, 'c', 3, 'd', 4, 'e', 5, 'f', 6]
+        output = StringIO()
+        self.assertEqual(table.render_new(output), 6)
+        self.assertIn('|   a', output.getvalue())
+        self.assertIn('name', output.getvalue())
+
+        # Any object with a `write` method is accepted
+        class Writer(object):
+            def __init__(self):
+                self.text = ''
+
+            def write(self, text):
+                self.text += text
+
+        output = Writer()
+        table.render_new(output)
+        table.add_data(['a name longer than the others', 6])
+        self.assertEqual(table.render_new(output), 1)
+        self.assertIn('a name longer than the others', output.text)
+
+    def test_load_json_chunks(self):
+        """
+        Test incremental `json` loading when values are split between chunks
+        """
+        json_path = self._input_folder / 'load_test.json'
+        expected_table = Table().load_data(json_path)
+        for chunk_size in [1, 2, 7, 64]:
+            table = Table().load_data(json_path, chunk_size=chunk_size)
+            self.assertEqual(table.get_column_content(), expected_table.get_column_content())
+            self.assertEqual(table._column_max, expected_table._column_max)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Numbers cut after `.`, `e` or `-` at the end of a chunk
+            json_path = Path(tmp_dir) / 'floats.json'
+            json_path.write_text('{"a": [12.5, 3e10, 1.25, -7, 2E-3], "b": [true, null, 0.5, [1.5, 2], -0.25]}')
+            for chunk_size in range(1, 25):
+                table = Table().load_data(json_path, chunk_size=chunk_size)
+                self.assertEqual(table.get_column_content(),
+                                 {'a': [12.5, 3e10, 1.25, -7, 2E-3], 'b': [True, None, 0.5, [1.5, 2], -0.25]})
+
+            json_path = Path(tmp_dir) / 'invalid.json'
+            json_path.write_text('{"Name": ["John", "Miquel"] "Age": [1, 2]}')
+            with self.assertRaises(ValueError):
+                Table().load_data(json_path)
+
+    def test_load_jsonl(self):
+        """
+        Test loading rows from a `json lines` file with objects and arrays
+        """
+        expected_data = self.get_test_expected()['test_load_json']
+        column_data = expected_data['column_data']
+        headers = list(column_data.keys())
+        rows = list(zip(*column_data.values()))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            objects_path = Path(tmp_dir) / 'objects.jsonl'
+            objects_path.write_text('\n'.join(json.dumps(dict(zip(headers, row))) for row in rows) + '\n\n')
+            arrays_path = Path(tmp_dir) / 'arrays.jsonl'
+            arrays_path.write_text('\n'.join(json.dumps(row) for row in [headers] + rows))
+
+            for table in [Table().load_jsonl(objects_path, batch_size=4), Table().load_jsonl(arrays_path)]:
+                self.assertEqual(table.get_column_content(), column_data)
+                self.assertEqual(table._column_max, expected_data['columns_max'])
+
+            table = Table().load_jsonl(objects_path, headers=['Country', 'Name'])
+            self.assertEqual(table.headers, ['Country', 'Name'])
+            self.assertEqual(table[1], ['France', 'Miquel'])
+
+    def test_load_csv(self):
+        """
+        Test loading a table from `csv` and `tsv` files
+        """
+        expected_data = self.get_test_expected()['test_load_json']
+        column_data = expected_data['column_data']
+        str_data = {k: list(map(str, v)) for k, v in column_data.items()}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = Path(tmp_dir) / 'table.csv'
+            with open(csv_path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(column_data.keys())
+                writer.writerows(zip(*column_data.values()))
+
+            for use_mmap in [False, True]:
+                table = Table().load_csv(csv_path, use_mmap=use_mmap, batch_size=4)
+                self.assertEqual(table.get_column_content(), str_data)
+                self.assertEqual(table._column_max, expected_data['columns_max'])
+
+            # Column subset
+            table = Table().load_csv(csv_path, header=True, columns=['Country', 1])
+            self.assertEqual(table.headers, ['Country', 'Age'])
+            self.assertEqual(table[0], ['EEUU', '33'])
+
+            # Tab separated values without header
+            tsv_path = Path(tmp_dir) / 'table.tsv'
+            tsv_path.write_text('a\t1\nb\t"2\t3"\nc\n')
+            table = Table().load_csv(tsv_path, delimiter='\t', header=False)
+            self.assertEqual(table.headers, ['0', '1'])
+            self.assertEqual(table.get_column_content(), {'0': ['a', 'b', 'c'], '1': ['1', '2\t3', '']})
+
+    def test_set_column_content(self):
+        """
+        Test bulk column loading pads short columns and doesn't modify the input
+        """
+        column_data = {'A': [1, 2, 3], 'B': ['x'], 'C': ('long value', None)}
+        table = Table().set_column_content(column_data)
+
+        self.assertEqual(column_data['B'], ['x'])
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(table[1], [2, '', None])
+        self.assertEqual(table._column_max, [1, 1, 10])
+        self.assertEqual(table.get_column_content()['C'], ['long value', None, ''])
+
+        # Columns with the same title are collapsed
+        table = Table([1, 2, 3, 4, 5], ['A', 'A'])
+        self.assertEqual(table.get_column_content(), {'A': [1, 2, 3, 4, 5]})
+
+    def test_from_cursor(self):
+        """
+        Test table creation from a DB-API cursor
+        """
+        data_obj = self.get_data()
+        headers = data_obj['headers']
+        rows = [Table(data_obj['data'], headers)[i] for i in range(14)]
+
+        connection = sqlite3.connect(':memory:')
+        connection.execute('CREATE TABLE cities ({})'.format(', '.join(headers)))
+        connection.executemany('INSERT INTO cities VALUES (?, ?, ?, ?)', rows)
+
+        table = Table.from_cursor(connection.execute('SELECT * FROM cities'), batch_size=4)
+        expected_table = Table(data_obj['data'], headers)
+        self.assertEqual(table.headers, headers)
+        self.assertEqual(table._column_max, expected_table._column_max)
+        self.assertEqual(table.render(), expected_table.render())
+
+        stream_table = StreamTable.from_cursor(connection.execute('SELECT * FROM cities'), batch_size=3)
+        self.assertEqual(stream_table.render(), expected_table.render())
+        connection.close()
+
+    def test_sort_filter(self):
+        """
+        Test sorted and filtered views
+        """
+        headers = ['NAME', 'COUNTRY', 'POPULATION']
+        data = ['Madrid', 'Spain', 3223, 'Lisbon', 'Portugal', 545, 'Sevilla', 'Spain', 688,
+                'Porto', 'Portugal', 231, 'Paris', 'France', 2161]
+        table = Table(data, headers)
+
+        sorted_view = table.sort_by('POPULATION', reverse=True)
+        self.assertEqual([sorted_view[i][0] for i in range(sorted_view.num_rows)],
+                         ['Madrid', 'Paris', 'Sevilla', 'Lisbon', 'Porto'])
+        self.assertEqual(sorted_view.render(rows=slice(1, 2)).splitlines()[3],
+                         table.render(rows=slice(4, 5)).splitlines()[3])
+
+        spain = table.where('COUNTRY', 'Spain')
+        self.assertEqual(spain.num_rows, 2)
+        # Views keep the column widths of the whole table
+        self.assertEqual(spain.render().splitlines()[3:5], table.render(rows=slice(0, 3, 2)).splitlines()[3:5])
+        self.assertEqual(table.where(1, 'Italy').num_rows, 0)
+        self.assertEqual(table.where(lambda row: row[2] < 1000).num_rows, 3)
+
+        # Filters and sorts can be chained and keep the columns of the view
+        view = table.view(show_columns=[0]).where('COUNTRY', 'Portugal').sort_by('NAME')
+        self.assertEqual(view.headers, ['NAME'])
+        self.assertEqual(view[0], ['Lisbon'])
+        self.assertEqual(view[1], ['Porto'])
+
+        output = StringIO()
+        table.sort_by('NAME').export(output, 'csv')
+        self.assertEqual(output.getvalue().splitlines()[1], 'Lisbon,Portugal,545')
+
+        # Hash indexes are updated with the new rows
+        table.create_index('COUNTRY')
+        self.assertEqual(table.where('COUNTRY', 'Spain').num_rows, 2)
+        table.add_data(['Valencia', 'Spain', 792])
+        self.assertEqual(table.where('COUNTRY', 'Spain').num_rows, 3)
+        table.table_data = data
+        self.assertEqual(table.where('COUNTRY', 'Spain').num_rows, 2)
+        # The index is rebuilt for the new data, not dropped
+        store, indexed_rows, positions = table._row_indexes[1]
+        self.assertIs(store, table._store)
+        self.assertEqual(indexed_rows, table.num_rows)
+        self.assertEqual(len(positions['Spain']), 2)
+
+        # Mixed columns keep the order of each type, empty cells last
+        padded = Table().set_column_content({'n': [10, 9, 100, None, 'x'], 's': list('abcdef')})
+        self.assertEqual([row[0] for row in padded.sort_by('n')], [9, 10, 100, 'x', None, ''])
+        self.assertEqual([row[0] for row in padded.sort_by('n', reverse=True)], ['x', 100, 10, 9, None, ''])
+
+        with self.assertRaises(ValueError):
+            table.sort_by('CITY')
+
+        with self.assertRaises(IndexError):
+            table.where(5, 'Spain')
+
+    def test_parallel_render(self):
+        """
+        Test rendering and width calculation with thread and process pools
+        """
+        data_obj = self.get_data()
+        headers = data_obj['headers']
+        data = data_obj['data'] * 50
+        expected_table = Table(data, headers, style=TabStyle(row_sep=True))
+
+        for executor_class in (ThreadPoolExecutor, ProcessPoolExecutor):
+            with executor_class(max_workers=2) as executor:
+                table = Table(headers=headers, style=TabStyle(row_sep=True), executor=executor)
+                table._parallel_chunk = 64
+                table._parallel_pending = 2
+                table.table_data = data
+                self.assertEqual(table._column_max, expected_table._column_max)
+
+                output = StringIO()
+                table.render_to(output)
+                self.assertEqual(output.getvalue(), expected_table.render())
+
+                output = StringIO()
+                table.sort_by(0).render_to(output, rows=slice(10, 500, 3))
+                self.assertEqual(output.getvalue(), expected_table.sort_by(0).render(rows=slice(10, 500, 3)))
+
+    def test_async(self):
+        """
+        Test async ingestion and rendering
+        """
+        data_obj = self.get_data()
+        headers = data_obj['headers']
+        expected_table = Table(data_obj['data'], headers)
+        expected_table._write_batch = 4
+
+        async def row_source():
+            for i in range(14):
+                await asyncio.sleep(0)
+                yield expected_table[i]
+
+        class AsyncWriter(object):
+            def __init__(self):
+                self.chunks = []
+
+            async def write(self, chunk):
+                self.chunks.append(chunk)
+
+        async def run():
+            table = await Table.from_async_iter(row_source(), headers, batch_size=3)
+            table._write_batch = 4
+            chunks = [chunk async for chunk in table.arender()]
+            writer = AsyncWriter()
+            await table.where(0, table[2][0]).render_to_async(writer)
+            return table, chunks, writer.chunks
+
+        table, chunks, view_chunks = asyncio.run(run())
+        self.assertEqual(table._column_max, expected_table._column_max)
+        self.assertEqual(chunks, list(expected_table._iter_chunks(expected_table.iter_lines())))
+        self.assertEqual(''.join(chunks), expected_table.render())
+        self.assertIn(expected_table[2][0], ''.join(view_chunks))
+
+        # Column widths are calculated in chunks, other tasks run meanwhile
+        table = Table(data_obj['data'] * 10, headers)
+        table._parallel_chunk = 5
+        ticks = []
+
+        async def ticker():
+            for i in range(10):
+                ticks.append(i)
+                await asyncio.sleep(0)
+
+        async def first_chunk():
+            task = asyncio.ensure_future(ticker())
+            await table.arender().__anext__()
+            ticks_before = len(ticks)
+            await task
+            return ticks_before
+
+        table._invalidate_widths()
+        self.assertEqual(asyncio.run(first_chunk()), 10)
+        self.assertFalse(table._dirty_widths)
+        self.assertEqual(table._column_max, Table(data_obj['data'] * 10, headers)._column_max)
+
+        # asyncio is only imported when it is used
+        code = 'import sys, tablat; print("asyncio" in sys.modules)'
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=Path(__file__).parent.parent, text=True)
+        self.assertEqual(output.strip(), 'False')
+
+    def test_render_cache(self):
+        """
+        Test the cache of rendered outputs
+        """
+        data_obj = self.get_data()
+        table = Table(data_obj['data'], data_obj['headers'])
+        table._render_cache_size = 2
+
+        output = str(table)
+        alignment = table.alignment
+        self.assertIs(str(table), output)
+        self.assertEqual(table.cache_info(), {'hits': 1, 'misses': 1, 'size': 1, 'max_size': 2})
+
+        # Different columns and rows are cached separately, the oldest output is dropped
+        table.render(hide_columns=[0])
+        table.render(rows=slice(2, 5))
+        self.assertEqual(table.cache_info()['size'], 2)
+        str(table)
+        self.assertEqual(table.cache_info()['misses'], 4)
+
+        # Data, alignment and style changes invalidate the outputs
+        table.add_data(data_obj['data'][:4])
+        self.assertNotEqual(str(table), output)
+        table.set_column_align(0, '^')
+        self.assertIn(table.headers[0].center(table._column_max[0]), str(table))
+        table.style.borders = False
+        self.assertFalse(str(table).startswith(' _'))
+        table.table_data = data_obj['data']
+        table.style.borders = True
+        table.alignment = alignment
+        self.assertEqual(str(table), output)
+        self.assertEqual(table.cache_info()['hits'], 1)
+
+        # Data added by other threads while an output is looked up
+        class RacingCache(OrderedDict):
+            def get(self, key, default=None):
+                value = super().get(key, default)
+                writers.append(threading.Thread(target=table.add_data, args=(data_obj['data'][:4],)))
+                writers[-1].start()
+                writers[-1].join(0.05)
+                return value
+
+        writers = []
+        table._render_cache = RacingCache(table._render_cache)
+        num_rows = table.num_rows
+        self.assertEqual(str(table), output)
+        for writer in writers:
+            writer.join()
+
+        self.assertEqual(table.num_rows, num_rows + 1)
+        self.assertNotEqual(str(table), output)
+
+    def test_lazy_widths(self):
+        """
+        Test data swaps and widths are calculated only when needed
+        """
+        scanned = []
+
+        class CountingStore(ColumnStore):
+            def text_width(self, index):
+                scanned.append(index)
+                return super().text_width(index)
+
+        class CountingTable(Table):
+            _store_class = CountingStore
+
+        data_obj = self.get_data()
+        headers = data_obj['headers']
+        expected_table = Table(data_obj['data'], headers)
+        table = CountingTable(data_obj['data'], headers)
+        self.assertEqual(scanned, [])
+
+        data = list(reversed(data_obj['data']))
+        table.table_data = data
+        self.assertIsNone(table._data_store)
+        self.assertEqual(table.table_data, data)
+        self.assertEqual(scanned, [])
+
+        table.table_data = data_obj['data']
+        self.assertEqual(table.render(), expected_table.render())
+        self.assertEqual(scanned, [0, 1, 2, 3])
+
+        # Only renamed columns are scanned again
+        table.headers = [headers[0], 'Name of the city'] + headers[2:]
+        self.assertEqual(table._column_max[1], 16)
+        self.assertEqual(scanned, [0, 1, 2, 3, 1])
+
+        # New rows update the widths without scanning the columns
+        table.add_data(['x' * 30] * 4)
+        self.assertEqual(table._column_max, [30] * 4)
+        self.assertEqual(len(scanned), 5)
+
+    def test_column_width(self):
+        """
+        Test declared column widths
+        """
+        headers = ['NAME', 'COUNTRY', 'DESCRIPTION']
+        data = ['Madrid', 'Spain', 'Capital and largest city of Spain',
+                'Lisbon', 'Portugal', 'Capital of Portugal']
+        table = Table(data, headers)
+        table.set_column_width('DESCRIPTION', 12)
+        table.set_column_width(1, 6, fixed=False, overflow='truncate')
+        self.assertEqual(table._column_max, [6, 6, 12])
+
+        lines = table.render().splitlines()
+        self.assertEqual(lines[1], '|   NAME     COUNTR    DESCRIPTION   |')
+        self.assertEqual(lines[3], '|   Madrid    Spain   Capital and…   |')
+        self.assertEqual(lines[4], '|   Lisbon   Portug   Capital of …   |')
+
+        # Declared widths are kept when the data changes
+        table.table_data = data[:3]
+        self.assertEqual(table._column_max, [6, 6, 12])
+
+        table.set_column_width('DESCRIPTION', None)
+        self.assertEqual(table._column_max, [6, 6, 33])
+
+        with self.assertRaises(ValueError):
+            table.set_column_width(0, 0)
+
+        with self.assertRaises(ValueError):
+            table.set_column_width(0, 5, overflow='wrap')
+
+        # With fixed widths in all the columns the source is not sampled
+        rows = iter([data[:3], data[3:]])
+        stream_table = StreamTable(rows, headers)
+        for i, width in enumerate([4, 4, 8]):
+            stream_table.set_column_width(i, width)
+
+        lines = stream_table.iter_lines()
+        self.assertEqual(next(lines), ' ' + '_' * 28 + ' ')
+        self.assertEqual(next(lines), '|   NAME   COU…   DESCRIP…   |')
+        self.assertEqual(next(rows), data[:3])
+
+    def test_stats(self):
+        """
+        Test operation timers, counters and hooks
+        """
+        data_obj = self.get_data()
+        table = Table(data_obj['data'], data_obj['headers'])
+        table.stats = TabStats()
+        events = []
+        table.stats.add_hook(lambda event, values: events.append((event, values)))
+
+        output = StringIO()
+        table.render_to(output)
+        self.assertEqual([event for event, _ in events], ['widths', 'render'])
+        self.assertEqual(events[1][1]['rows'], 14)
+        self.assertEqual(events[1][1]['chars'], len(output.getvalue()))
+        self.assertEqual(table.stats.counters['cells_stringified'], len(data_obj['data']))
+
+        str(table)
+        str(table)
+        table.where(0, table[0][0]).export(StringIO(), 'json')
+        counters = table.stats.counters
+        self.assertEqual((counters['cache_hits'], counters['cache_misses']), (1, 1))
+        self.assertEqual(counters['operations'], 3)
+        self.assertEqual(counters['rows_rendered'], 14 * 2 + 1)
+        self.assertEqual(events[-1][0], 'export')
+
+        values = table.stats.as_dict()
+        self.assertGreater(values['total_seconds'], 0)
+        self.assertGreaterEqual(values['total_seconds'], values['write_seconds'] + values['widths_seconds'])
+
+        table.stats.reset()
+        self.assertEqual(table.stats.counters['operations'], 0)
+
+    def test_appender(self):
+        """
+        Test concurrent appenders keep the rows complete while the table is rendered
+        """
+        table = Table(headers=['THREAD', 'NUM', 'KEY'])
+        num_threads, num_rows = 4, 3000
+
+        def produce(thread_id):
+            with table.appender(batch_size=100) as appender:
+                for i in range(num_rows):
+                    appender.add_row([thread_id, i, '{}-{}'.format(thread_id, 'x' * (i % 50))])
+
+                appender.add_row([thread_id])
+
+        threads = [threading.Thread(target=produce, args=(i,)) for i in range(num_threads)]
+        for thread in threads:
+            thread.start()
+
+        while any(thread.is_alive() for thread in threads):
+            lines = table.render().splitlines()
+            self.assertEqual(len(set(map(len, lines[1:]))), 1)
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(table.num_rows, num_threads * (num_rows + 1))
+        for i in range(table.num_rows):
+            thread_id, num, key = table[i]
+            self.assertTrue(key == '' or key == '{}-{}'.format(thread_id, 'x' * (num % 50)))
+
+        self.assertEqual(table._column_max, [6, 4, 51])
+
+    def test_concurrent_store(self):
+        """
+        Test readers and writers of a table with pending initial data use the same store
+        """
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, switch_interval)
+        for _ in range(50):
+            table = Table(list(range(2000)), ['A', 'B'])
+            errors = []
+
+            def read():
+                try:
+                    table.head(2)
+                except Exception as e:
+                    errors.append(e)
+
+            def write():
+                try:
+                    table.add_data([1, 2])
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=target) for target in (read, write, read, write)]
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(errors, [])
+            self.assertEqual(table.num_rows, 1002)
+
+    def test_pickle(self):
+        """
+        Test tables can be pickled and copied, the lock is not shared
+        """
+        data_obj = self.get_data()
+        table = Table(data_obj['data'], data_obj['headers'])
+        table.set_column_align(0, '<')
+        for other in [pickle.loads(pickle.dumps(table)), copy.deepcopy(table)]:
+            self.assertEqual(other.render(), table.render())
+            self.assertIsNot(other._lock, table._lock)
+            other.add_data(data_obj['data'][:len(data_obj['headers'])])
+            self.assertEqual(other.num_rows, table.num_rows + 1)
+
+        compact = CompactTable(data_obj['data'], data_obj['headers'])
+        self.assertEqual(pickle.loads(pickle.dumps(compact)).render(), table.render())
+
     def preview(self):
         data_obj = self.get_data()
         table = Table(data_obj['data'], data_obj['headers'])
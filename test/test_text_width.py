@@ -0,0 +1,73 @@
+from tablat import Table, StreamTable, TextWidth
+import unittest
+
+
+class TestTextWidth(unittest.TestCase):
+
+    def test_width(self):
+        """
+        Test the display width of ASCII, wide, combining and coloured texts
+        """
+        self.assertEqual(TextWidth.width('Madrid'), 6)
+        self.assertEqual(TextWidth.width(''), 0)
+        self.assertEqual(TextWidth.width('café'), 4)
+        self.assertEqual(TextWidth.width('東京'), 4)
+        self.assertEqual(TextWidth.width('😀 ok'), 5)
+        self.assertEqual(TextWidth.width('café'), 4)
+        self.assertEqual(TextWidth.width('\x1b[1;31mred\x1b[0m'), 3)
+        self.assertEqual(TextWidth.width('\x1b[32m東京\x1b[0m'), 4)
+
+        self.assertEqual(TextWidth.max_width(['a', '東京', 'abc']), 4)
+        self.assertEqual(TextWidth.max_width(iter(['a', '\x1b[31mabc\x1b[0m'])), 3)
+        self.assertEqual(TextWidth.max_width([]), 0)
+        self.assertEqual(TextWidth.max_width([str(i) for i in range(10000)]), 4)
+
+    def test_pad_clip(self):
+        """
+        Test padding and cutting texts by their display width
+        """
+        self.assertEqual(TextWidth.pad('東京', 6, '<'), '東京  ')
+        self.assertEqual(TextWidth.pad('東京', 6, '>'), '  東京')
+        self.assertEqual(TextWidth.pad('東', 5, '^'), format('ab', '^5').replace('ab', '東'))
+        self.assertEqual(TextWidth.pad('東京', 3, '<'), '東京')
+
+        self.assertEqual(TextWidth.clip('Madrid', 4), 'Madr')
+        self.assertEqual(TextWidth.clip('Madrid', 4, '…'), 'Mad…')
+        self.assertEqual(TextWidth.clip('東京都', 5), '東京')
+        self.assertEqual(TextWidth.clip('東京都', 4, '…'), '東…')
+        self.assertEqual(TextWidth.clip('\x1b[31mMadrid\x1b[0m', 3), '\x1b[31mMad\x1b[0m')
+        self.assertEqual(TextWidth.clip('\x1b[31mred\x1b[0m', 3), '\x1b[31mred\x1b[0m')
+
+    def test_table_alignment(self):
+        """
+        Test tables with wide and coloured cells are aligned by display width
+        """
+        headers = ['CITY', 'N']
+        data = ['東京', 12, '\x1b[31mred\x1b[0m', 'x', 'café', 3, '😀😀', 4]
+        table = Table(data, headers)
+        self.assertEqual(table._column_max, [4, 2])
+
+        lines = table.render().splitlines()
+        self.assertEqual(lines[1], '|   CITY    N   |')
+        self.assertEqual(lines[3], '|   東京   12   |')
+        self.assertEqual(lines[4], '|   \x1b[31mred\x1b[0m     x   |')
+        self.assertEqual(lines[5], '|   café    3   |')
+        self.assertEqual(lines[6], '|   😀😀    4   |')
+
+        # Widths are also updated by display width when data is added
+        table.add_data(['東京都', 1])
+        self.assertEqual(table._column_max, [6, 2])
+
+        table.set_column_width(0, 3)
+        lines = table.render().splitlines()
+        self.assertEqual(lines[3], '|   東…   12   |')
+        self.assertEqual(lines[4], '|   \x1b[31mred\x1b[0m    x   |')
+
+        stream = StreamTable(iter([['東京', 1], ['a', 2]]), headers)
+        lines = stream.render().splitlines()
+        self.assertEqual(lines[1], '|   CITY   N   |')
+        self.assertEqual(lines[3], '|   東京   1   |')
+
+
+if __name__ == '__main__':
+    unittest.main()